@@ -4,18 +4,33 @@ King God Castle AIO - Main Entry Point
 A modern, cross-platform GUI application built with CustomTkinter
 """
 
-import sys, os
+import sys, logging, queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-# Add src directory to Python path
-src_path = os.getcwd()
-sys.path.insert(0, str(src_path))
+# Add the project root (this file's directory) to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from src.gui.main_window import MainWindow
 
 
+def setup_logging():
+    """Route log records through a queue so console writes happen off the UI thread"""
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, console)
+    listener.start()
+    return listener
+
+
 def main():
     """Main entry point for the application"""
+    listener = setup_logging()
     try:
         app = MainWindow()
         app.run()
@@ -25,6 +40,8 @@ def main():
     except Exception as e:
         print(f"Error starting application: {e}")
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
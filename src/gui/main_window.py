@@ -3,35 +3,134 @@ Main Window
 The main application window with navigation and screen management
 """
 
+import tkinter as tk
 from tkinter import Menu
 import customtkinter as ctk
-import sys, os
-from typing import Dict, Type
+import os, logging, threading
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Type
 from src.screens import XAPKInstallScreen, EditorWindow, SettingsScreen, BaseScreen
 from src.utils.config import ConfigManager
 
+log = logging.getLogger(__name__)
+
+# Options shared by the menubar and every cascade (tearoff is ignored on menubars)
+_MENU_KW = dict(
+    tearoff=0,
+    background="#2d2d2d",
+    foreground="#e0e0e0",
+    activebackground="#404040",
+    activeforeground="#ffffff",
+)
+
 
 class MainWindow:
     """Main application window with modern floating design"""
 
+    # Menubar: (title, ((label, accelerator, method name or (name, *args)) | None))
+    _MENUBAR = (
+        (
+            "File",
+            (
+                ("New Project", "Ctrl+N", "new_project"),
+                ("Open Project", "Ctrl+O", "open_project"),
+                ("Recent Projects", "", "show_recent_projects"),
+                None,
+                ("Settings", "Ctrl+,", "show_settings"),
+                None,
+                ("Exit", "Ctrl+Q", "on_closing"),
+            ),
+        ),
+        (
+            "View",
+            (
+                ("Unity Editor", "", ("show_screen", "unity_editor")),
+                ("XAPK Installer", "", ("show_screen", "xapk_install")),
+                None,
+                ("Toggle Fullscreen", "F11", "toggle_fullscreen"),
+                ("Reset Layout", "", "reset_layout"),
+                None,
+                ("Zoom In", "Ctrl++", "zoom_in"),
+                ("Zoom Out", "Ctrl+-", "zoom_out"),
+                ("Reset Zoom", "Ctrl+0", "reset_zoom"),
+            ),
+        ),
+        (
+            "Tools",
+            (
+                ("Asset Ripper", "", "open_asset_ripper"),
+                ("Unity Hub", "", "open_unity_hub"),
+                None,
+                ("Install & Setup XAPK", "", "extract_xapk"),
+                ("Build Project", "Ctrl+B", "build_project"),
+                None,
+                ("Package Manager", "", "open_package_manager"),
+                ("Version Control", "", "open_version_control"),
+            ),
+        ),
+        (
+            "Project",
+            (
+                ("Project Settings", "", "show_project_settings"),
+                ("Build Settings", "", "show_build_settings"),
+                None,
+                ("Import Package", "", "import_package"),
+                ("Export Package", "", "export_package"),
+                None,
+                ("Refresh Assets", "Ctrl+R", "refresh_assets"),
+                ("Reimport All", "", "reimport_all"),
+            ),
+        ),
+        (
+            "Window",
+            (
+                ("Minimize", "Ctrl+M", "minimize_window"),
+                ("Maximize", "", "maximize_window"),
+                None,
+                ("Always on Top", "", "toggle_always_on_top"),
+                ("Transparency", "", "adjust_transparency"),
+            ),
+        ),
+        (
+            "Help",
+            (
+                ("Documentation", "F1", "show_documentation"),
+                ("Keyboard Shortcuts", "Ctrl+/", "show_shortcuts"),
+                ("Tutorials", "", "show_tutorials"),
+                None,
+                ("Report Bug", "", "report_bug"),
+                ("Feature Request", "", "feature_request"),
+                None,
+                ("Check for Updates", "", "check_updates"),
+                ("About", "", "show_about"),
+            ),
+        ),
+    )
+
     def __init__(self):
         self.config = ConfigManager()
+        self._app_cfg = self.config.snapshot("window")
 
-        # Configure CustomTkinter
-        ctk.set_appearance_mode(self.config.get_theme_setting("theme.mode", "dark"))
+        # The color theme must be loaded before CTk() reads its fg_color
         ctk.set_default_color_theme(
             self.config.get_theme_setting("theme.color_theme", "blue")
         )
 
-        # Create main window
+        # Create main window first so the appearance mode is applied to it once
         self.root: ctk.CTk = ctk.CTk()
+        ctk.set_appearance_mode(self.config.get_theme_setting("theme.mode", "dark"))
 
         self.setup_window()
 
-        # Screen management
-        self.screens: Dict[str, BaseScreen] = {}
+        # Screen management - screens are built on first show
+        self._screen_ids: Tuple[str, ...] = ()
+        self._screen_index: Dict[str, int] = {}
+        self._screen_factories: Tuple[Callable[[], BaseScreen], ...] = ()
+        self._screens: List[Optional[BaseScreen]] = []
         self.current_screen = None
         self.navigation_stack = []  # Track navigation history
+        self._pending_screen: Optional[Tuple[str, bool]] = None
+        self._nav_after_id = None
 
         # Initialize UI
         self.setup_ui()
@@ -43,326 +142,37 @@ class MainWindow:
     def setup_menubar(self):
         """Create a professional menu bar using tkinter Menu"""
         # Create main menubar with dark theme
-        menubar = Menu(
-            self.root,
-            background="#2d2d2d",
-            foreground="#e0e0e0",
-            activebackground="#404040",
-            activeforeground="#ffffff",
-            borderwidth=0,
-            relief="flat",
-        )
+        menubar = Menu(self.root, **_MENU_KW, borderwidth=0, relief="flat")
         self.root.config(menu=menubar)
 
-        # File Menu
-        file_menu = Menu(
-            menubar,
-            tearoff=0,
-            background="#2d2d2d",
-            foreground="#e0e0e0",
-            activebackground="#404040",
-            activeforeground="#ffffff",
-        )
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(
-            label="New Project", command=self.new_project, accelerator="Ctrl+N"
-        )
-        file_menu.add_command(
-            label="Open Project", command=self.open_project, accelerator="Ctrl+O"
-        )
-        file_menu.add_command(
-            label="Recent Projects", command=self.show_recent_projects
-        )
-        file_menu.add_separator()
-        file_menu.add_command(
-            label="Settings", command=self.show_settings, accelerator="Ctrl+,"
-        )
-        file_menu.add_separator()
-        file_menu.add_command(
-            label="Exit", command=self.on_closing, accelerator="Ctrl+Q"
-        )
-
-        # View Menu
-        view_menu = Menu(
-            menubar,
-            tearoff=0,
-            background="#2d2d2d",
-            foreground="#e0e0e0",
-            activebackground="#404040",
-            activeforeground="#ffffff",
-        )
-        menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(
-            label="Unity Editor", command=lambda: self.show_screen("unity_editor")
-        )
-        view_menu.add_command(
-            label="XAPK Installer",
-            command=lambda: self.show_screen("xapk_install"),
-        )
-        view_menu.add_separator()
-        view_menu.add_command(
-            label="Toggle Fullscreen", command=self.toggle_fullscreen, accelerator="F11"
-        )
-        view_menu.add_command(label="Reset Layout", command=self.reset_layout)
-        view_menu.add_separator()
-        view_menu.add_command(
-            label="Zoom In", command=self.zoom_in, accelerator="Ctrl++"
-        )
-        view_menu.add_command(
-            label="Zoom Out", command=self.zoom_out, accelerator="Ctrl+-"
-        )
-        view_menu.add_command(
-            label="Reset Zoom", command=self.reset_zoom, accelerator="Ctrl+0"
-        )
-
-        # Tools Menu
-        tools_menu = Menu(
-            menubar,
-            tearoff=0,
-            background="#2d2d2d",
-            foreground="#e0e0e0",
-            activebackground="#404040",
-            activeforeground="#ffffff",
-        )
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Asset Ripper", command=self.open_asset_ripper)
-        tools_menu.add_command(label="Unity Hub", command=self.open_unity_hub)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Install & Setup XAPK", command=self.extract_xapk)
-        tools_menu.add_command(
-            label="Build Project", command=self.build_project, accelerator="Ctrl+B"
-        )
-        tools_menu.add_separator()
-        tools_menu.add_command(
-            label="Package Manager", command=self.open_package_manager
-        )
-        tools_menu.add_command(
-            label="Version Control", command=self.open_version_control
-        )
-
-        # Project Menu
-        project_menu = Menu(
-            menubar,
-            tearoff=0,
-            background="#2d2d2d",
-            foreground="#e0e0e0",
-            activebackground="#404040",
-            activeforeground="#ffffff",
-        )
-        menubar.add_cascade(label="Project", menu=project_menu)
-        project_menu.add_command(
-            label="Project Settings", command=self.show_project_settings
-        )
-        project_menu.add_command(
-            label="Build Settings", command=self.show_build_settings
-        )
-        project_menu.add_separator()
-        project_menu.add_command(label="Import Package", command=self.import_package)
-        project_menu.add_command(label="Export Package", command=self.export_package)
-        project_menu.add_separator()
-        project_menu.add_command(
-            label="Refresh Assets", command=self.refresh_assets, accelerator="Ctrl+R"
-        )
-        project_menu.add_command(label="Reimport All", command=self.reimport_all)
-
-        # Window Menu
-        window_menu = Menu(
-            menubar,
-            tearoff=0,
-            background="#2d2d2d",
-            foreground="#e0e0e0",
-            activebackground="#404040",
-            activeforeground="#ffffff",
-        )
-        menubar.add_cascade(label="Window", menu=window_menu)
-        window_menu.add_command(
-            label="Minimize", command=self.minimize_window, accelerator="Ctrl+M"
-        )
-        window_menu.add_command(label="Maximize", command=self.maximize_window)
-        window_menu.add_separator()
-        window_menu.add_command(
-            label="Always on Top", command=self.toggle_always_on_top
-        )
-        window_menu.add_command(label="Transparency", command=self.adjust_transparency)
-
-        # Help Menu
-        help_menu = Menu(
-            menubar,
-            tearoff=0,
-            background="#2d2d2d",
-            foreground="#e0e0e0",
-            activebackground="#404040",
-            activeforeground="#ffffff",
-        )
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(
-            label="Documentation", command=self.show_documentation, accelerator="F1"
-        )
-        help_menu.add_command(
-            label="Keyboard Shortcuts",
-            command=self.show_shortcuts,
-            accelerator="Ctrl+/",
-        )
-        help_menu.add_command(label="Tutorials", command=self.show_tutorials)
-        help_menu.add_separator()
-        help_menu.add_command(label="Report Bug", command=self.report_bug)
-        help_menu.add_command(label="Feature Request", command=self.feature_request)
-        help_menu.add_separator()
-        help_menu.add_command(label="Check for Updates", command=self.check_updates)
-        help_menu.add_command(label="About", command=self.show_about)
-
-    def create_menu_buttons(self, parent):
-        """Create menu buttons for the menubar"""
-        menu_data = [
-            (
-                "File",
-                [
-                    ("New Project", self.new_project),
-                    ("Open Project", self.open_project),
-                    ("separator", None),
-                    ("Settings", self.show_settings),
-                    ("separator", None),
-                    ("Exit", self.on_closing),
-                ],
-            ),
-            (
-                "View",
-                [
-                    ("Unity Editor", lambda: self.show_screen("unity_editor")),
-                    ("XAPK Installer", lambda: self.show_screen("xapk_install")),
-                    ("separator", None),
-                    ("Toggle Fullscreen", self.toggle_fullscreen),
-                    ("Reset Layout", self.reset_layout),
-                ],
-            ),
-            (
-                "Tools",
-                [
-                    ("Asset Ripper", self.open_asset_ripper),
-                    ("Unity Hub", self.open_unity_hub),
-                    ("separator", None),
-                    ("Extract XAPK", self.extract_xapk),
-                    ("Build Project", self.build_project),
-                ],
-            ),
-            (
-                "Help",
-                [
-                    ("Documentation", self.show_documentation),
-                    ("Keyboard Shortcuts", self.show_shortcuts),
-                    ("separator", None),
-                    ("Check Updates", self.check_updates),
-                    ("About", self.show_about),
-                ],
-            ),
-        ]
-
-        for i, (menu_title, menu_items) in enumerate(menu_data):
-            menu_btn = self.create_menu_dropdown(parent, menu_title, menu_items)
-            menu_btn.grid(row=0, column=i, padx=2, pady=2)
-
-    def create_menu_dropdown(self, parent, title, menu_items):
-        """Create a dropdown menu button"""
-        menu_btn = ctk.CTkButton(
-            parent,
-            text=title,
-            width=60,
-            height=24,
-            font=ctk.CTkFont(size=11, weight="normal"),
-            fg_color="transparent",
-            hover_color="#404040",
-            text_color="#e0e0e0",
-            border_width=0,
-            corner_radius=3,
-        )
-
-        def show_dropdown():
-            # Hide other dropdowns first
-            self.hide_menu_dropdowns()
-
-            # Create dropdown window
-            dropdown = ctk.CTkToplevel(self.root)
-            dropdown.withdraw()
-            dropdown.overrideredirect(True)
-            dropdown.configure(fg_color="#2d2d2d", pady=2)
-            dropdown.wm_attributes("-topmost", True)
-
-            # Create menu items
-            for idx, (item_text, command) in enumerate(menu_items):
-                if item_text == "separator":
-                    sep = ctk.CTkFrame(dropdown, height=1, fg_color="#404040")
-                    sep.pack(fill="x", padx=8, pady=2)
-                else:
-                    item_btn = ctk.CTkButton(
-                        dropdown,
-                        text=item_text,
-                        height=26,
-                        font=ctk.CTkFont(size=10),
-                        fg_color="transparent",
-                        hover_color="#404040",
-                        text_color="#e8e8e8",
-                        anchor="w",
-                        command=lambda cmd=command, dw=dropdown: self.execute_menu_command(
-                            cmd, dw
-                        ),
-                    )
-                    item_btn.pack(fill="x", padx=4, pady=2)
-
-            # Position dropdown
-            btn_x = menu_btn.winfo_rootx()
-            btn_y = menu_btn.winfo_rooty() + menu_btn.winfo_height() + 5
-            dropdown.geometry(f"+{btn_x}+{btn_y}")
-
-            # Show dropdown
-            dropdown.deiconify()
-            dropdown.lift()
-
-            # Store reference
-            setattr(menu_btn, "_dropdown", dropdown)
-            menu_btn.configure(fg_color="#404040")
-
-            # Close dropdown on click outside
-            def close_on_click(event):
-                try:
-                    dropdown.destroy()
-                    menu_btn.configure(fg_color="transparent")
-                    self.root.unbind("<Button-1>")
-                except:
-                    pass
-
-            self.root.after(
-                100, lambda: self.root.bind("<Button-1>", close_on_click, add="+")
+        for menu_title, spec_items in self._MENUBAR:
+            menubar.add_cascade(
+                label=menu_title, menu=self._build_menu(menubar, spec_items)
             )
 
-        menu_btn.configure(command=show_dropdown)
-        return menu_btn
-
-    def hide_menu_dropdowns(self):
-        """Hide all open menu dropdowns"""
-        try:
-            for child in self.root.winfo_children():
-                if isinstance(child, ctk.CTkToplevel) and hasattr(
-                    child, "wm_overrideredirect"
-                ):
-                    try:
-                        child.destroy()
-                    except:
-                        pass
-        except:
-            pass
-
-    def execute_menu_command(self, command, dropdown_window):
-        """Execute menu command and close dropdown"""
-        try:
-            dropdown_window.destroy()
-        except:
-            pass
+    def _build_menu(self, parent, spec_items):
+        """Build one menubar cascade from its _MENUBAR entries"""
+        menu = Menu(parent, **_MENU_KW)
+        for item in spec_items:
+            if item is None:
+                menu.add_separator()
+                continue
+            label, accelerator, target = item
+            menu.add_command(
+                label=label,
+                command=self._resolve_menu_command(target),
+                accelerator=accelerator,
+            )
+        return menu
 
-        if command:
-            try:
-                command()
-            except Exception as e:
-                print(f"Menu command error: {e}")
+    def _resolve_menu_command(self, target):
+        """Turn a _MENUBAR target (method name or (name, *args)) into a callable"""
+        if target is None:
+            return None
+        if isinstance(target, str):
+            return getattr(self, target)
+        name, *args = target
+        return partial(getattr(self, name), *args)
 
     def setup_window(self):
         """Configure the main window"""
@@ -370,8 +180,8 @@ class MainWindow:
         self.root.title(self.config.get_app_setting("app_name", "King God Castle AIO"))
 
         # Window size and position
-        width = self.config.get_app_setting("window.default_width", 1200)
-        height = self.config.get_app_setting("window.default_height", 800)
+        width = self._app_cfg.get("window.default_width", 1200)
+        height = self._app_cfg.get("window.default_height", 800)
 
         # Center window on screen
         screen_width = self.root.winfo_screenwidth()
@@ -382,17 +192,17 @@ class MainWindow:
         self.root.geometry(f"{width}x{height}+{x}+{y}")
 
         # Window behavior
-        min_width = self.config.get_app_setting("window.min_width", 800)
-        min_height = self.config.get_app_setting("window.min_height", 600)
+        min_width = self._app_cfg.get("window.min_width", 800)
+        min_height = self._app_cfg.get("window.min_height", 600)
         self.root.minsize(min_width, min_height)
 
         # Floating window (always on top) - default behavior
-        if self.config.get_app_setting("window.floating", True):
+        if self._app_cfg.get("window.floating", True):
             self.root.attributes("-topmost", True)
             self.root.attributes("-type", "utility")
 
         # Transparency
-        transparency = self.config.get_app_setting("window.transparency", 0.95)
+        transparency = self._app_cfg.get("window.transparency", 0.95)
         self.root.attributes("-alpha", transparency)
 
         # Protocol handlers
@@ -400,8 +210,9 @@ class MainWindow:
 
     def setup_ui(self):
         """Setup the main user interface"""
-        # Menu bar (tkinter Menu doesn't take grid space)
-        self.setup_menubar()
+        # Menu bar (tkinter Menu doesn't take grid space) - built once the
+        # event loop is idle so the root window paints first
+        self.root.after_idle(self.setup_menubar)
 
         # Configure grid - main content uses full space since Menu doesn't use grid
         self.root.grid_columnconfigure(1, weight=1)
@@ -411,8 +222,10 @@ class MainWindow:
 
         # Don't create sidebar initially - it will be created when needed
         self.sidebar = None
+        self._sidebar_visible = True
 
-        # Create main content area
+        # Create main content area (screens are placed in it, so their
+        # geometry requests never propagate up to the root)
         self.main_frame = ctk.CTkFrame(self.root)
         self.main_frame.grid(
             row=0, column=1, sticky="nsew", padx=0, pady=0
@@ -423,51 +236,96 @@ class MainWindow:
     def update_layout_for_screen(self, screen_id: str):
         """Update layout based on screen requirements"""
         # Check if this screen should hide sidebar
-        hide_sidebar = self.config.get_app_setting(
-            f"screens.{screen_id}.hide_sidebar", False
-        )
+        hide_sidebar = screen_id in self._screens_hide_sidebar
+        if self._sidebar_visible == (not hide_sidebar):
+            return  # Sidebar visibility doesn't change
 
         if hide_sidebar:
             # Hide sidebar if it exists and expand main frame
+            self._sidebar_visible = False
             if self.sidebar:
                 self.sidebar.grid_remove()
             self.root.grid_columnconfigure(0, weight=0)
             self.root.grid_columnconfigure(1, weight=1)
-            self.main_frame.grid(
-                row=0,  # Back to row 0 since Menu doesn't use grid
-                column=0,
-                columnspan=2,
-                sticky="nsew",
-                padx=0,
-                pady=0,
-            )
+            self.main_frame.grid_configure(column=0, columnspan=2)
+
+    @property
+    def screens(self) -> Dict[str, BaseScreen]:
+        """Screens that have been built so far, keyed by screen id"""
+        return {
+            screen_id: screen
+            for screen_id, screen in zip(self._screen_ids, self._screens)
+            if screen is not None
+        }
 
     def setup_screens(self):
-        """Initialize all application screens"""
+        """Register all application screens (instantiated lazily on first show)"""
         screen_classes: Dict[str, Type[BaseScreen]] = {
             "unity_editor": EditorWindow,
             "xapk_install": XAPKInstallScreen,
             "settings": SettingsScreen,
         }
 
+        factories = []
         for screen_id, screen_class in screen_classes.items():
             if screen_id == "unity_editor":
                 # Unity Editor screen needs special initialization
-                screen = screen_class(
+                factory = lambda cls=screen_class: cls(
                     self.main_frame, main_window=self, unity_project_path=None
                 )
             else:
-                screen = screen_class(self.main_frame, main_window=self)
-            screen.grid(row=0, column=0, sticky="nsew")
-            screen.grid_remove()  # Hide initially
-            self.screens[screen_id] = screen
+                factory = lambda cls=screen_class: cls(
+                    self.main_frame, main_window=self
+                )
+            factories.append(factory)
+
+        self._screen_ids = tuple(screen_classes)
+        self._screen_index = {
+            screen_id: i for i, screen_id in enumerate(self._screen_ids)
+        }
+        self._screen_factories = tuple(factories)
+        self._screens = [None] * len(self._screen_ids)
+
+        # Resolve per-screen layout flags once instead of on every navigation
+        self._screens_hide_sidebar = frozenset(
+            screen_id
+            for screen_id in screen_classes
+            if self.config.get_app_setting(f"screens.{screen_id}.hide_sidebar", False)
+        )
+
+    def _materialize(self, index: int) -> BaseScreen:
+        """Build the screen at index and stack it over the main frame"""
+        screen = self._screen_factories[index]()
+        screen.place(in_=self.main_frame, x=0, y=0, relwidth=1, relheight=1)
+        self._screens[index] = screen
+        return screen
 
     def show_screen(self, screen_id: str, add_to_history: bool = True):
-        """Show a specific screen"""
-        if screen_id not in self.screens:
+        """Show a specific screen (coalesced with other requests in the same tick)"""
+        if screen_id not in self._screen_index:
             print(f"Warning: Screen '{screen_id}' not found")
             return
 
+        # Only the latest request survives until the event loop is idle
+        self._pending_screen = (screen_id, add_to_history)
+        if self._nav_after_id is None:
+            self._nav_after_id = self.root.after_idle(self._do_pending_nav)
+
+    def _do_pending_nav(self):
+        """Perform the most recent navigation queued by show_screen"""
+        self._nav_after_id = None
+        pending, self._pending_screen = self._pending_screen, None
+        if pending is not None:
+            self._switch_screen(*pending)
+
+    def _switch_screen(self, screen_id: str, add_to_history: bool = True):
+        """Swap the visible screen"""
+        index = self._screen_index[screen_id]
+
+        # Already showing this screen - nothing to hide or re-grid
+        if screen_id == self.current_screen:
+            return
+
         # Update layout for this screen
         self.update_layout_for_screen(screen_id)
 
@@ -475,25 +333,27 @@ class MainWindow:
         if add_to_history and self.current_screen and self.current_screen != screen_id:
             self.navigation_stack.append(self.current_screen)
 
-        # Hide current screen
+        # Hide current screen (it stays placed; the new one is raised over it)
         if self.current_screen:
-            self.screens[self.current_screen].grid_remove()
-            self.screens[self.current_screen].on_hide()
+            self._screens[self._screen_index[self.current_screen]].on_hide()
+
+        # Build the screen on first visit, then raise it to the top of the stack
+        screen = self._screens[index]
+        if screen is None:
+            screen = self._materialize(index)
+        screen.lift()
 
         # Show new screen
-        self.screens[screen_id].grid()
-        self.screens[screen_id].on_show()
+        screen.on_show()
         self.current_screen = screen_id
 
     def on_closing(self):
         """Handle window closing"""
+        # Destroying the root ends mainloop(); run() and main() then return normally
         try:
-            self.root.quit()
             self.root.destroy()
-        except:
-            pass
-        finally:
-            sys.exit(0)
+        except tk.TclError:
+            pass  # Already destroyed
 
     def go_back(self):
         """Navigate back to previous screen"""
@@ -523,30 +383,40 @@ class MainWindow:
     def open_project(self):
         """Open an existing Unity project and show in editor screen"""
         from tkinter import filedialog
-        import os
 
         project_folder = filedialog.askdirectory(title="Chọn thư mục dự án Unity")
         if not project_folder:
-            print("⚠️ Đã hủy chọn dự án")
+            log.info("⚠️ Đã hủy chọn dự án")
             return
-        # Kiểm tra hợp lệ
+        # Kiểm tra hợp lệ trên luồng phụ, tải dự án trên luồng UI
+        threading.Thread(
+            target=self._validate_project, args=(project_folder,), daemon=True
+        ).start()
+
+    def _validate_project(self, project_folder):
+        """Check the selected folder off the UI thread, then hand it back to Tk"""
         project_settings = os.path.join(
             project_folder, "ProjectSettings", "ProjectVersion.txt"
         )
         if not os.path.exists(project_settings):
-            print("❌ Thư mục đã chọn không phải là dự án Unity hợp lệ")
-            print("💡 Hãy chọn thư mục chứa file ProjectSettings/ProjectVersion.txt")
+            log.warning("❌ Thư mục đã chọn không phải là dự án Unity hợp lệ")
+            log.warning(
+                "💡 Hãy chọn thư mục chứa file ProjectSettings/ProjectVersion.txt"
+            )
             return
-        # Load project vào EditorWindow
+        self.root.after(0, self._load_project_into_editor, project_folder)
+
+    def _load_project_into_editor(self, project_folder):
+        """Load a validated project into the EditorWindow (UI thread only)"""
         editor = self.screens.get("unity_editor")
         load_project_method = getattr(editor, "load_project", None)
         if editor and callable(load_project_method):
             load_project_method(project_folder)
-            print(f"✅ Đã mở dự án Unity: {os.path.basename(project_folder)}")
-            print(f"📂 Đường dẫn: {project_folder}")
+            log.info("✅ Đã mở dự án Unity: %s", os.path.basename(project_folder))
+            log.info("📂 Đường dẫn: %s", project_folder)
             self.show_screen("unity_editor")
         else:
-            print(
+            log.error(
                 "❌ Không tìm thấy màn hình Unity Editor hoặc phương thức load_project"
             )
 
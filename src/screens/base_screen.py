@@ -1,14 +1,13 @@
 """
 Base Screen Class
-Abstract base class for all application screens
+Base class for all application screens
 """
 
 import customtkinter as ctk
-from abc import ABC, abstractmethod
 
 
-class BaseScreen(ctk.CTkFrame, ABC):
-    """Abstract base class for all application screens"""
+class BaseScreen(ctk.CTkFrame):
+    """Base class for all application screens"""
 
     def __init__(self, parent, main_window=None, **kwargs):
         super().__init__(parent, **kwargs)
@@ -16,10 +15,11 @@ class BaseScreen(ctk.CTkFrame, ABC):
         self.main_window = main_window
         self.setup_ui()
 
-    @abstractmethod
     def setup_ui(self):
         """Setup the user interface for this screen"""
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement setup_ui()"
+        )
 
     def on_show(self):
         """Called when the screen is shown"""
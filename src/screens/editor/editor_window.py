@@ -4,9 +4,54 @@ import subprocess
 import platform
 import glob
 import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from tkinter import filedialog
 import customtkinter as ctk
 from ..base_screen import BaseScreen
+from src.utils.tk_bindings import unbind_callback, is_within_widget
+
+log = logging.getLogger(__name__)
+
+# Host OS, fixed for the life of the process
+_SYSTEM = platform.system()
+
+# Hero folders are named "<id> (<name>)"; plain "<name>" folders have no id
+_HERO_FOLDER_RE = re.compile(r"^([^(]*?)\s*\(([^()]*)\)?\s*$")
+
+# Output panel keeps the last _OUTPUT_MAX_LINES lines, trimmed once it
+# grows past _OUTPUT_TRIM_AT_LINES
+_OUTPUT_MAX_LINES = 2000
+_OUTPUT_TRIM_AT_LINES = 2500
+
+# Visit sibling directories in inode order so walks on spinning disks follow
+# the on-disk layout; DirEntry.inode() is free on POSIX but a stat on Windows
+_ORDER_BY_INODE = os.name != "nt"
+_entry_inode = os.DirEntry.inode
+
+# Project stats formatters, bound once
+_FMT_MB = "{:.1f} MB".format
+_FMT_GB = "{:.1f} GB".format
+_FMT_COUNT = "{:,}".format
+
+# Seconds a project size / file count stays valid while the root is unchanged
+_PROJECT_STATS_TTL = 5
+
+# Regenerated, build output and VCS folders skipped at any depth wherever the
+# project is walked (project info stats and analyze_project)
+_PROJECT_SKIPPED_DIRS = frozenset(
+    {"Library", "Temp", "Logs", "obj", "Build", "Builds", ".git", "node_modules"}
+)
+_PROJECT_SKIPPED_DIRS_BYTES = frozenset(
+    os.fsencode(name) for name in _PROJECT_SKIPPED_DIRS
+)
+
+# Hero rows built per idle slice while populating the explorer
+_HERO_ROWS_PER_CHUNK = 20
 
 
 class ResizableFrame(ctk.CTkFrame):
@@ -22,6 +67,8 @@ class ResizableFrame(ctk.CTkFrame):
         self.is_dragging = False
         self.start_pos = 0
         self.start_size = 0
+        self._pending_size = None
+        self._resize_after_id = None
 
     def create_resize_handle(self, side="right"):
         """Create a resize handle on the specified side"""
@@ -66,18 +113,70 @@ class ResizableFrame(ctk.CTkFrame):
 
         if self.orientation == "vertical":
             delta = event.x_root - self.start_pos
-            new_size = max(self.min_size, min(self.max_size, self.start_size + delta))
-            self.configure(width=new_size)
         else:
             delta = event.y_root - self.start_pos
-            new_size = max(self.min_size, min(self.max_size, self.start_size + delta))
-            self.configure(height=new_size)
+        self._pending_size = max(
+            self.min_size, min(self.max_size, self.start_size + delta)
+        )
+
+        # Apply at most once per frame (~60 Hz) while dragging
+        if self._resize_after_id is None:
+            self._resize_after_id = self.after(16, self._apply_resize)
+
+    def _apply_resize(self):
+        self._resize_after_id = None
+        if self._pending_size is None:
+            return
+        if self.orientation == "vertical":
+            self.configure(width=self._pending_size)
+        else:
+            self.configure(height=self._pending_size)
+        self._pending_size = None
 
     def stop_resize(self, event):
         self.is_dragging = False
+        # Commit the final size right away
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._apply_resize()
 
 
 class EditorWindow(BaseScreen):
+    # Dropdown menus: (label, method name, needs a loaded project)
+    _MENUS = {
+        "File": (
+            ("📁 Chọn folder Unity", "load_existing_project", False),
+            ("📂 Mở thư mục dự án", "open_project_folder", True),
+            ("🔄 Refresh dự án", "refresh_project", True),
+            ("🗑️ Xóa dự án đã lưu", "clear_last_project", False),
+        ),
+        "Project": (
+            ("🔄 Load XAPK to Unity", "go_to_xapk_converter", False),
+            ("🎮 Mở Unity Editor", "open_in_unity", True),
+            ("🔍 Phân tích dự án", "analyze_project", True),
+        ),
+        "Tools": (
+            ("📦 Tải game (XAPK)", "download_xapk_game", False),
+            ("🛠️ AssetRipper", "show_tools_info", False),
+            ("📱 APK Tools", "show_tools_info", False),
+        ),
+        "Help": (
+            ("❓ Trợ giúp", "show_help", False),
+            ("⚙️ Cài đặt", "open_settings", False),
+            ("📋 Thông tin", "show_about", False),
+        ),
+    }
+
+    # Hover shade for each button color
+    _HOVER_COLORS = {
+        "#0e639c": "#1177bb",
+        "#4CAF50": "#45a049",
+        "#FF9800": "#F57C00",
+        "#6c757d": "#5a6268",
+        "#2196F3": "#1976D2",
+        "#9C27B0": "#7B1FA2",
+    }
+
     def __init__(self, parent, main_window=None, unity_project_path=None):
         self.unity_project_path = unity_project_path
 
@@ -91,42 +190,120 @@ class EditorWindow(BaseScreen):
         self.min_bottom_height = 100
         self.max_bottom_height = 400
 
+        # Widgets created by setup_ui (None until built)
+        self.sidebar_frame = None
+        self.explorer_content = None
+        self.explorer_collapse_btn = None
+        self.bottom_container = None
+        self.bottom_frame = None
+        self.bottom_collapse_btn = None
+        self.output_text = None
+
+        # Drag-resize state (applied at most once per frame)
+        self._pending_width = None
+        self._pending_height = None
+        self._sidebar_resize_after_id = None
+        self._bottom_resize_after_id = None
+
+        # Output panel messages waiting for the next flush
+        self._pending_output = []
+        self._output_flush_id = None
+        self._output_line_count = 0
+
+        # Last-project config location (directory is created on first save)
+        self._config_dir = os.path.expanduser("~/.kinggodcastle")
+        self._config_file = os.path.join(self._config_dir, "last_project.json")
+
+        # Project state the current layout was built for, and the widgets
+        # refresh_layout updates in place while that state holds
+        self._layout_has_project = None
+        self._heroes_title_label = None
+        self._editor_label = None
+
+        # Bottom panel column span, set by setup_ui from the project state
+        self._bottom_columnspan = 1
+
+        # Explorer placeholder labels (created when first shown)
+        self._no_project_label = None
+        self._no_heroes_label = None
+
+        # Fonts shared across widgets, keyed by (size, weight)
+        self._fonts = {}
+
+        # Pending hero rows still to be built, one chunk per idle slice
+        self._heroes_iter = None
+        self._heroes_parent = None
+        self._hero_chunk_id = None
+
+        # Bind tag shared by all hero row widgets
+        self._hero_tag = f"HeroRow{id(self)}"
+
+        # File tree folder rows keyed by path
+        self._tree_nodes = {}
+
+        # Unity editor executable, found on first "Open in Unity"
+        self._unity_path_cache = None
+
+        # Project (size, file count) keyed by project path, holding
+        # (root mtime, stats, time computed)
+        self._stats_cache = {}
+        self._stats_pending = False
+        # Project whose last walk failed; not re-walked until it is reloaded
+        self._stats_failed_path = None
+
+        # Project info labels refreshed when stats come in
+        self._project_size_label = None
+        self._project_files_label = None
+
+        # Parsed Unity versions keyed by (ProjectVersion.txt path, mtime)
+        self._version_cache = {}
+
+        # Last hero listing as ((heroes folder, folder mtime), heroes)
+        self._heroes_cache = (None, None)
+
         # Auto-load last project if no project specified
         if not self.unity_project_path:
             self.unity_project_path = self.load_last_project()
+        self._invalidate_project_cache()
 
         super().__init__(parent, main_window=main_window)
 
+        self.bind("<<ProjectStatsReady>>", self._refresh_project_stats_labels)
+
     def toggle_bottom_panel(self):
         """Toggle bottom panel collapse/expand"""
-        print(f"Toggle bottom panel called - collapsed: {self.bottom_collapsed}")
+        log.debug("Toggle bottom panel called - collapsed: %s", self.bottom_collapsed)
         self.bottom_collapsed = not self.bottom_collapsed
-        if hasattr(self, "bottom_container"):
+        if self.bottom_container is not None:
             if self.bottom_collapsed:
                 self.bottom_container.grid_remove()
-                if hasattr(self, "bottom_collapse_btn"):
+                if self.bottom_collapse_btn is not None:
                     self.bottom_collapse_btn.configure(text="▲")
-                print("Bottom panel hidden")
+                log.debug("Bottom panel hidden")
             else:
-                columnspan = 2 if self.has_project() else 1
                 self.bottom_container.grid(
-                    row=2, column=0, columnspan=columnspan, sticky="ew", padx=0, pady=0
+                    row=2,
+                    column=0,
+                    columnspan=self._bottom_columnspan,
+                    sticky="ew",
+                    padx=0,
+                    pady=0,
                 )
-                if hasattr(self, "bottom_collapse_btn"):
+                if self.bottom_collapse_btn is not None:
                     self.bottom_collapse_btn.configure(text="▼")
-                print("Bottom panel shown")
+                log.debug("Bottom panel shown")
         return "break"
 
     def toggle_explorer(self):
         """Toggle explorer section collapse/expand"""
         self.explorer_collapsed = not self.explorer_collapsed
-        if hasattr(self, "explorer_content"):
+        if self.explorer_content is not None:
             if self.explorer_collapsed:
                 self.explorer_content.grid_remove()
-                if hasattr(self, "explorer_collapse_btn"):
+                if self.explorer_collapse_btn is not None:
                     self.explorer_collapse_btn.configure(text="▶")
                 # When explorer is collapsed, no weight changes needed
-                if hasattr(self, "sidebar_frame"):
+                if self.sidebar_frame is not None:
                     self.sidebar_frame.grid_rowconfigure(
                         0, weight=0
                     )  # Explorer collapsed
@@ -134,10 +311,10 @@ class EditorWindow(BaseScreen):
                 self.explorer_content.grid(
                     row=1, column=0, sticky="nsew", padx=0, pady=0
                 )
-                if hasattr(self, "explorer_collapse_btn"):
+                if self.explorer_collapse_btn is not None:
                     self.explorer_collapse_btn.configure(text="▼")
                 # When explorer is expanded, it takes available space
-                if hasattr(self, "sidebar_frame"):
+                if self.sidebar_frame is not None:
                     self.sidebar_frame.grid_rowconfigure(
                         0, weight=1
                     )  # Explorer expands
@@ -147,7 +324,7 @@ class EditorWindow(BaseScreen):
         self.sidebar_width = max(
             self.min_sidebar_width, min(self.max_sidebar_width, new_width)
         )
-        if hasattr(self, "sidebar_frame"):
+        if self.sidebar_frame is not None:
             self.sidebar_frame.configure(width=self.sidebar_width)
             self.main_container.grid_columnconfigure(
                 0, weight=0, minsize=self.sidebar_width
@@ -158,40 +335,40 @@ class EditorWindow(BaseScreen):
         self.bottom_height = max(
             self.min_bottom_height, min(self.max_bottom_height, new_height)
         )
-        if hasattr(self, "bottom_frame"):
+        if self.bottom_frame is not None:
             self.bottom_frame.configure(height=self.bottom_height)
 
     def get_config_file_path(self):
         """Get path to config file for storing last project"""
-        config_dir = os.path.expanduser("~/.kinggodcastle")
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-        return os.path.join(config_dir, "last_project.json")
+        return self._config_file
 
     def save_last_project(self, project_path):
         """Save last opened project path"""
         try:
             config_data = {
                 "last_project_path": str(project_path),
-                "last_opened": datetime.datetime.now().isoformat(),
+                "last_opened": time.strftime("%Y-%m-%dT%H:%M:%S"),
             }
-            with open(self.get_config_file_path(), "w") as f:
-                json.dump(config_data, f, indent=2)
+            # Serialize in memory so the file gets a single write call
+            payload = json.dumps(config_data, indent=2).encode("utf-8")
+            os.makedirs(self._config_dir, exist_ok=True)
+            with open(self.get_config_file_path(), "wb", buffering=0) as f:
+                f.write(payload)
         except Exception as e:
-            print(f"Warning: Could not save last project: {e}")
+            log.warning("Could not save last project: %s", e)
 
     def load_last_project(self):
         """Load last opened project path"""
         try:
             config_file = self.get_config_file_path()
             if os.path.exists(config_file):
-                with open(config_file, "r") as f:
-                    config_data = json.load(f)
+                with open(config_file, "rb") as f:
+                    config_data = json.loads(f.read())
                     project_path = config_data.get("last_project_path")
                     if project_path and os.path.exists(project_path):
                         return project_path
         except Exception as e:
-            print(f"Warning: Could not load last project: {e}")
+            log.warning("Could not load last project: %s", e)
         return None
 
     def clear_last_project(self):
@@ -200,19 +377,46 @@ class EditorWindow(BaseScreen):
             config_file = self.get_config_file_path()
             if os.path.exists(config_file):
                 os.remove(config_file)
+                self._invalidate_project_cache()
                 self.add_output_message("🗑️ Đã xóa dự án đã lưu")
         except Exception as e:
-            print(f"Warning: Could not clear last project: {e}")
+            log.warning("Could not clear last project: %s", e)
+
+    def _invalidate_project_cache(self):
+        """Normalize unity_project_path and forget cached project checks"""
+        path = self.unity_project_path
+        self.unity_project_path = os.fspath(path) if path else None
+        self._heroes_folder = (
+            os.path.join(self.unity_project_path, "Assets", "01_Fx", "1_Hero")
+            if self.unity_project_path
+            else None
+        )
+        self._has_project_cache = None
+        self._project_name_cache = None
+        self._stats_failed_path = None
+        self._cancel_hero_population()
 
     def has_project(self):
-        """Check if project is loaded and exists"""
-        return self.unity_project_path and os.path.exists(str(self.unity_project_path))
+        """Check if project is loaded and exists (cached until invalidated)"""
+        if self._has_project_cache is None:
+            self._has_project_cache = bool(
+                self.unity_project_path
+                and os.path.isdir(self.unity_project_path)
+            )
+        return self._has_project_cache
 
     def get_project_name(self):
         """Get project name or return default text"""
+        cached = self._project_name_cache
+        if cached is not None and cached[0] == self.unity_project_path:
+            return cached[1]
+
         if self.has_project():
-            return os.path.basename(str(self.unity_project_path))
-        return "Chưa chọn dự án"
+            name = os.path.basename(self.unity_project_path)
+        else:
+            name = "Chưa chọn dự án"
+        self._project_name_cache = (self.unity_project_path, name)
+        return name
 
     def setup_ui(self):
         """Set up VSCode-like Editor interface"""
@@ -220,8 +424,13 @@ class EditorWindow(BaseScreen):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
+        # Project state is fixed for the whole layout pass
+        has = self.has_project()
+        self._layout_has_project = has
+        self._bottom_columnspan = 2 if has else 1
+
         # Check if we auto-loaded a project and notify user
-        if self.has_project():
+        if has:
             project_name = self.get_project_name()
             self.add_output_message(
                 f"🔄 Đã tự động tải dự án từ phiên trước: {project_name}"
@@ -238,7 +447,7 @@ class EditorWindow(BaseScreen):
         )  # Make main content area expandable (row 1 again)
 
         # Dynamic column configuration based on project state
-        if self.has_project():
+        if has:
             self.main_container.grid_columnconfigure(
                 0, weight=0, minsize=self.sidebar_width
             )  # Left sidebar
@@ -247,7 +456,7 @@ class EditorWindow(BaseScreen):
             self.main_container.grid_columnconfigure(0, weight=1)  # Full width editor
 
         # Left sidebar (only if project loaded)
-        if self.has_project():
+        if has:
             self.setup_left_sidebar(self.main_container)
 
         # Main editor area
@@ -261,11 +470,11 @@ class EditorWindow(BaseScreen):
 
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts for the editor"""
-        print("Setting up keyboard shortcuts...")
+        log.debug("Setting up keyboard shortcuts...")
 
         # Get the top level window for global shortcuts
         top_level = self.winfo_toplevel()
-        print(f"Top level widget: {top_level}")
+        log.debug("Top level widget: %s", top_level)
 
         # Bind shortcuts to toplevel window for global access
         top_level.bind("<Control-j>", self.on_ctrl_j)
@@ -280,17 +489,17 @@ class EditorWindow(BaseScreen):
 
         # Set initial focus after a delay
         self.after(100, lambda: self.focus_force())
-        print("Keyboard shortcuts setup complete")
+        log.debug("Keyboard shortcuts setup complete")
 
     def on_ctrl_j(self, event):
         """Handle Ctrl+J shortcut"""
-        print("Ctrl+J pressed!")
+        log.debug("Ctrl+J pressed")
         self.toggle_bottom_panel()
         return "break"
 
     def on_ctrl_e(self, event):
         """Handle Ctrl+E shortcut - Toggle Explorer"""
-        print("Ctrl+E pressed!")
+        log.debug("Ctrl+E pressed")
         self.toggle_explorer()
         return "break"
 
@@ -309,6 +518,7 @@ class EditorWindow(BaseScreen):
             # Check if it's a valid Unity project
             if self.is_unity_project(project_folder):
                 self.unity_project_path = project_folder
+                self._invalidate_project_cache()
 
                 # Save this project as the last opened project
                 self.save_last_project(project_folder)
@@ -443,17 +653,32 @@ class EditorWindow(BaseScreen):
     def on_sidebar_resize(self, event):
         """Handle sidebar resize"""
         delta = event.x_root - self.resize_start_x
-        new_width = max(
+        self._pending_width = max(
             self.min_sidebar_width,
             min(self.max_sidebar_width, self.resize_start_width + delta),
         )
+
+        # Apply at most once per frame (~60 Hz) while dragging
+        if self._sidebar_resize_after_id is None:
+            self._sidebar_resize_after_id = self.after(16, self._apply_sidebar_resize)
+
+    def _apply_sidebar_resize(self):
+        """Apply the latest pending sidebar width"""
+        self._sidebar_resize_after_id = None
+        new_width = self._pending_width
+        if new_width is None:
+            return
+        self._pending_width = None
         self.sidebar_frame.configure(width=new_width)
         self.sidebar_width = new_width
         self.main_container.grid_columnconfigure(0, weight=0, minsize=new_width)
 
     def stop_sidebar_resize(self, event):
         """Stop resizing sidebar"""
-        pass
+        # Commit the final width right away
+        if self._sidebar_resize_after_id is not None:
+            self.after_cancel(self._sidebar_resize_after_id)
+        self._apply_sidebar_resize()
 
     def setup_file_explorer(self, parent):
         """Create simplified file explorer"""
@@ -475,13 +700,13 @@ class EditorWindow(BaseScreen):
         header_frame.grid_columnconfigure(1, weight=0)
 
         heroes_list = self.load_heroes_from_folder()
-        title_label = ctk.CTkLabel(
+        self._heroes_title_label = ctk.CTkLabel(
             header_frame,
             text=f"HEROES ({len(heroes_list)})",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold"),
             text_color="#cccccc",
         )
-        title_label.grid(row=0, column=0, sticky="w", padx=15, pady=10)
+        self._heroes_title_label.grid(row=0, column=0, sticky="w", padx=15, pady=10)
 
         # Collapse button for explorer
         self.explorer_collapse_btn = ctk.CTkButton(
@@ -489,7 +714,7 @@ class EditorWindow(BaseScreen):
             text="▼",
             width=20,
             height=20,
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             fg_color="transparent",
             text_color="#cccccc",
             hover_color="#404040",
@@ -517,116 +742,108 @@ class EditorWindow(BaseScreen):
             pass  # Keep focus for now
 
         explorer_frame.bind("<Enter>", on_enter)
-        self.explorer_content.bind("<Enter>", on_enter)
+        self.explorer_content.bind("<Enter>", on_enter, add="+")
 
-        self.populate_simple_file_tree(self.explorer_content)
+        self.populate_simple_file_tree(self.explorer_content, heroes_list)
 
     def bind_mousewheel_to_widget(self, widget):
         """Bind mouse wheel events to a widget for scrolling"""
 
+        # Resolve the scrollable target once instead of probing on every tick;
+        # CTkScrollableFrame scrolls through its internal canvas
+        target = getattr(widget, "_parent_canvas", None)
+        if target is None and hasattr(widget, "_scrollable_frame"):
+            target = next(
+                (c for c in widget.winfo_children() if hasattr(c, "yview_scroll")),
+                None,
+            )
+        if target is None and hasattr(widget, "yview_scroll"):
+            target = widget
+        widget._wheel_target = target
+
         def on_mousewheel(event):
-            # For CTkScrollableFrame, we need to scroll the internal canvas
-            try:
-                if hasattr(widget, "_parent_canvas") and widget._parent_canvas:
-                    canvas = widget._parent_canvas
-                    canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-                elif hasattr(widget, "_scrollable_frame") and hasattr(
-                    widget._scrollable_frame, "master"
-                ):
-                    # Try to find the canvas in CTkScrollableFrame
-                    for child in widget.winfo_children():
-                        if hasattr(child, "yview_scroll"):
-                            child.yview_scroll(int(-1 * (event.delta / 120)), "units")
-                            break
-                elif hasattr(widget, "yview_scroll"):
-                    widget.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            except:
-                pass  # Silently ignore errors
+            target = widget._wheel_target
+            if target is not None:
+                target.yview_scroll(int(-1 * (event.delta / 120)), "units")
             return "break"
 
         def on_mousewheel_linux(event):
             # Linux mouse wheel events (Button-4 = scroll up, Button-5 = scroll down)
-            try:
-                scroll_direction = -1 if event.num == 4 else 1
-                if hasattr(widget, "_parent_canvas") and widget._parent_canvas:
-                    canvas = widget._parent_canvas
-                    canvas.yview_scroll(scroll_direction, "units")
-                elif hasattr(widget, "_scrollable_frame") and hasattr(
-                    widget._scrollable_frame, "master"
-                ):
-                    # Try to find the canvas in CTkScrollableFrame
-                    for child in widget.winfo_children():
-                        if hasattr(child, "yview_scroll"):
-                            child.yview_scroll(scroll_direction, "units")
-                            break
-                elif hasattr(widget, "yview_scroll"):
-                    widget.yview_scroll(scroll_direction, "units")
-            except:
-                pass  # Silently ignore errors
+            target = widget._wheel_target
+            if target is not None:
+                target.yview_scroll(-1 if event.num == 4 else 1, "units")
             return "break"
 
-        # Bind mouse wheel events
-        widget.bind("<MouseWheel>", on_mousewheel)
-        widget.bind("<Button-4>", on_mousewheel_linux)
-        widget.bind("<Button-5>", on_mousewheel_linux)
+        # While the pointer is over the widget, route wheel events through the
+        # toplevel binding; it runs before the "all" tag and "break"s there
+        top_level = self.winfo_toplevel()
+        wheel_handlers = (
+            ("<MouseWheel>", on_mousewheel),
+            ("<Button-4>", on_mousewheel_linux),
+            ("<Button-5>", on_mousewheel_linux),
+        )
+        bound = []
 
-        # Also bind to the widget and its frame
-        def bind_recursive(w):
-            try:
-                w.bind("<MouseWheel>", on_mousewheel)
-                w.bind("<Button-4>", on_mousewheel_linux)
-                w.bind("<Button-5>", on_mousewheel_linux)
-                # Bind to children after a delay
-                w.after(
-                    50,
-                    lambda: [
-                        bind_recursive(child)
-                        for child in w.winfo_children()
-                        if child.winfo_exists()
-                    ],
-                )
-            except:
-                pass
+        def on_enter(event):
+            if bound:
+                return
+            for sequence, handler in wheel_handlers:
+                bound.append((sequence, top_level.bind(sequence, handler, add="+")))
+
+        def on_leave(event):
+            # Moving onto a child also fires <Leave>; keep the binding then
+            hovered = widget.winfo_containing(event.x_root, event.y_root)
+            if hovered is not None and is_within_widget(hovered, widget):
+                return
+            for sequence, funcid in bound:
+                unbind_callback(top_level, sequence, funcid)
+            bound.clear()
 
-        # Initial binding and delayed recursive binding
-        widget.after(100, lambda: bind_recursive(widget))
+        widget.bind("<Enter>", on_enter, add="+")
+        widget.bind("<Leave>", on_leave, add="+")
 
     def load_heroes_from_folder(self):
         """Load heroes from Assets/01_Fx/1_Hero folder"""
         try:
-            project_path = str(self.unity_project_path)
-            heroes_folder = os.path.join(project_path, "Assets", "01_Fx", "1_Hero")
+            heroes_folder = self._heroes_folder
 
-            if not os.path.exists(heroes_folder):
+            # Listing is cached until the folder's mtime changes
+            try:
+                cache_key = (heroes_folder, os.stat(heroes_folder).st_mtime_ns)
+            except OSError:
                 self.add_output_message(
                     f"⚠️ Heroes folder not found: Assets/01_Fx/1_Hero"
                 )
                 return []
 
+            cached_key, cached = self._heroes_cache
+            if cached_key == cache_key:
+                return cached
+
             heroes_data = []
 
             # Get all subfolders in the hero folder
             try:
-                hero_folders = [
-                    d
-                    for d in os.listdir(heroes_folder)
-                    if os.path.isdir(os.path.join(heroes_folder, d))
-                ]
+                with os.scandir(heroes_folder) as it:
+                    hero_folders = sorted(
+                        entry.name
+                        for entry in it
+                        if entry.is_dir(follow_symlinks=False)
+                    )
 
                 self.add_output_message(
                     f"📁 Found {len(hero_folders)} hero folders in Assets/01_Fx/1_Hero"
                 )
 
-                for i, hero_folder in enumerate(sorted(hero_folders)):
-                    # Extract hero name from folder name
-                    hero_name_id = (
-                        hero_folder.replace(" (", "(").replace(")", "").split("(")
-                    )
-
-                    hero_id = hero_name_id[0] if len(hero_name_id) > 1 else ""
-                    hero_name = (
-                        hero_name_id[1] if len(hero_name_id) > 1 else hero_name_id[0]
-                    ).capitalize()
+                for hero_folder in hero_folders:
+                    # Extract hero id and name from "<id> (<name>)" folder names
+                    match = _HERO_FOLDER_RE.match(hero_folder)
+                    if match:
+                        hero_id = match.group(1)
+                        hero_name = match.group(2).capitalize()
+                    else:
+                        hero_id = ""
+                        hero_name = hero_folder.capitalize()
 
                     hero_data = {
                         "id": hero_id,
@@ -640,82 +857,158 @@ class EditorWindow(BaseScreen):
                 self.add_output_message(f"❌ Error reading heroes folder: {str(e)}")
                 return []
 
+            self._heroes_cache = (cache_key, heroes_data)
             return heroes_data
 
         except Exception as e:
             self.add_output_message(f"❌ Error loading heroes: {str(e)}")
             return []
 
-    def populate_simple_file_tree(self, parent):
-        """Populate heroes list from Assets/01_Fx/1_Hero folder"""
+    def populate_simple_file_tree(self, parent, heroes_data=None):
+        """Populate heroes list from Assets/01_Fx/1_Hero folder
+
+        heroes_data can be passed in when the caller already loaded it.
+        """
+        self._cancel_hero_population()
+
+        # Clear previous hero rows; placeholders are kept and re-packed
+        placeholders = (self._no_project_label, self._no_heroes_label)
+        for child in parent.winfo_children():
+            if child in placeholders:
+                child.pack_forget()
+            else:
+                child.destroy()
+
         if not self.has_project() or not self.unity_project_path:
             # Show placeholder when no project
-            no_project_label = ctk.CTkLabel(
+            self._no_project_label = self._show_placeholder(
                 parent,
-                text="📁 Chọn dự án để xem heroes",
-                font=ctk.CTkFont(size=10),
-                text_color="#888888",
+                self._no_project_label,
+                "📁 Chọn dự án để xem heroes",
+                "#888888",
             )
-            no_project_label.pack(padx=10, pady=20)
             return
 
         # Load heroes from Assets/01_Fx/1_Hero folder
-        heroes_data = self.load_heroes_from_folder()
+        if heroes_data is None:
+            heroes_data = self.load_heroes_from_folder()
 
         if not heroes_data:
             # Show message when no heroes found
-            no_heroes_label = ctk.CTkLabel(
+            self._no_heroes_label = self._show_placeholder(
                 parent,
-                text="⚔️ Không tìm thấy heroes trong Assets/01_Fx/1_Hero",
-                font=ctk.CTkFont(size=10),
-                text_color="#f48771",
+                self._no_heroes_label,
+                "⚔️ Không tìm thấy heroes trong Assets/01_Fx/1_Hero",
+                "#f48771",
             )
-            no_heroes_label.pack(padx=10, pady=20)
             return
 
-        # Heroes list
-        for hero in heroes_data:
-            # Hero frame
-            hero_frame = ctk.CTkFrame(parent, fg_color="#3d3d3d", corner_radius=4)
-            hero_frame.pack(fill="x", padx=4, pady=6)
-            hero_frame.grid_columnconfigure(1, weight=1)
-
-            # Hero info container
-            info_frame = ctk.CTkFrame(hero_frame, fg_color="transparent")
-            info_frame.grid(row=0, column=1, sticky="ew", padx=10, pady=3)
-            info_frame.grid_columnconfigure(0, weight=1)
-
-            # Hero name and ID
-            name_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-            name_frame.grid(row=0, column=0, sticky="ew")
-            name_frame.grid_columnconfigure(0, weight=1)
-
-            name_label = ctk.CTkLabel(
-                name_frame,
-                text=hero["name"],
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color="#ffffff",
-                anchor="w",
-            )
-            name_label.grid(row=0, column=0, sticky="w")
+        # One class binding serves every hero row (rows carry the tag)
+        self.bind_class(self._hero_tag, "<Button-1>", self.on_hero_click)
 
-            id_label = ctk.CTkLabel(
-                name_frame,
-                text=hero["id"],
-                font=ctk.CTkFont(size=9),
-                text_color="#888888",
-                anchor="e",
+        # Heroes list, built in chunks so the explorer appears right away
+        self._heroes_parent = parent
+        self._heroes_iter = iter(heroes_data)
+        self._populate_chunk()
+
+    def _show_placeholder(self, parent, label, text, text_color):
+        """Pack a placeholder label in parent, creating it only when needed"""
+        if label is None or label.master is not parent or not label.winfo_exists():
+            label = ctk.CTkLabel(
+                parent,
+                text=text,
+                font=self._font(10),
+                text_color=text_color,
             )
-            id_label.grid(row=0, column=1, sticky="e", padx=(5, 0))
+        label.pack(padx=10, pady=20)
+        return label
+
+    def _populate_chunk(self):
+        """Build the next chunk of hero rows and reschedule if more remain"""
+        self._hero_chunk_id = None
+        parent = self._heroes_parent
+        if self._heroes_iter is None or not parent.winfo_exists():
+            self._heroes_iter = self._heroes_parent = None
+            return
+
+        built = 0
+        for hero in islice(self._heroes_iter, _HERO_ROWS_PER_CHUNK):
+            self._build_hero_row(parent, hero)
+            built += 1
+
+        if built == _HERO_ROWS_PER_CHUNK:
+            self._hero_chunk_id = self.after_idle(self._populate_chunk)
+        else:
+            self._heroes_iter = self._heroes_parent = None
+
+    def _cancel_hero_population(self):
+        """Stop building hero rows for a list that is being replaced"""
+        if self._hero_chunk_id is not None:
+            self.after_cancel(self._hero_chunk_id)
+            self._hero_chunk_id = None
+        self._heroes_iter = self._heroes_parent = None
+
+    def _build_hero_row(self, parent, hero):
+        """Create one clickable hero row in parent"""
+        # Hero frame
+        hero_frame = ctk.CTkFrame(parent, fg_color="#3d3d3d", corner_radius=4)
+        hero_frame.pack(fill="x", padx=4, pady=6)
+        hero_frame.grid_columnconfigure(1, weight=1)
+
+        # Hero info container
+        info_frame = ctk.CTkFrame(hero_frame, fg_color="transparent")
+        info_frame.grid(row=0, column=1, sticky="ew", padx=10, pady=3)
+        info_frame.grid_columnconfigure(0, weight=1)
 
-            # Add click handler for hero selection
-            def bind_hero_click(widget, hero_data):
-                """Bind click event to widget and all its children"""
-                widget.bind("<Button-1>", lambda e, h=hero_data: self.select_hero(h))
-                for child in widget.winfo_children():
-                    bind_hero_click(child, hero_data)
+        # Hero name and ID
+        name_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+        name_frame.grid(row=0, column=0, sticky="ew")
+        name_frame.grid_columnconfigure(0, weight=1)
 
-            bind_hero_click(hero_frame, hero)
+        name_label = ctk.CTkLabel(
+            name_frame,
+            text=hero["name"],
+            font=self._font(11, "bold"),
+            text_color="#ffffff",
+            anchor="w",
+        )
+        name_label.grid(row=0, column=0, sticky="w")
+
+        id_label = ctk.CTkLabel(
+            name_frame,
+            text=hero["id"],
+            font=self._font(9),
+            text_color="#888888",
+            anchor="e",
+        )
+        id_label.grid(row=0, column=1, sticky="e", padx=(5, 0))
+
+        # Clicks anywhere in the row resolve back to this hero
+        hero_frame._hero = hero
+        self._tag_hero_row(hero_frame)
+
+    def _font(self, size, weight="normal"):
+        """Return a shared CTkFont, creating it on first use"""
+        font = self._fonts.get((size, weight))
+        if font is None:
+            font = self._fonts[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+        return font
+
+    def _tag_hero_row(self, widget):
+        """Route clicks on widget and its descendants through the hero row tag"""
+        widget.bindtags((self._hero_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._tag_hero_row(child)
+
+    def on_hero_click(self, event):
+        """Dispatch a click inside any hero row to select_hero"""
+        widget = event.widget
+        while widget is not None:
+            hero = getattr(widget, "_hero", None)
+            if hero is not None:
+                self.select_hero(hero)
+                return
+            widget = getattr(widget, "master", None)
 
     def select_hero(self, hero):
         """Handle hero selection"""
@@ -738,7 +1031,7 @@ class EditorWindow(BaseScreen):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📁 EXPLORER",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=self._font(11, "bold"),
             text_color="#cccccc",
         )
         title_label.grid(row=0, column=0, sticky="w", padx=10, pady=5)
@@ -767,7 +1060,7 @@ class EditorWindow(BaseScreen):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📋 PROJECT INFO",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=self._font(11, "bold"),
             text_color="#cccccc",
         )
         title_label.grid(row=0, column=0, sticky="w", padx=10, pady=5)
@@ -784,75 +1077,139 @@ class EditorWindow(BaseScreen):
         if not self.has_project() or not self.unity_project_path:
             return
 
-        import os
+        project_path = self.unity_project_path
 
-        project_path = str(self.unity_project_path)
+        # Folder rows by path; children are listed only when a row is expanded
+        self._tree_nodes = {}
 
         try:
             # Show main project folders
             main_folders = ["Assets", "Packages", "ProjectSettings", "UserSettings"]
 
+            # One directory read answers all four existence checks
+            wanted = set(main_folders)
+            with os.scandir(project_path) as it:
+                present = {
+                    entry.name: entry.path
+                    for entry in it
+                    if entry.name in wanted and entry.is_dir(follow_symlinks=False)
+                }
+
             for folder in main_folders:
-                folder_path = os.path.join(project_path, folder)
-                if os.path.exists(folder_path):
-                    folder_btn = ctk.CTkButton(
-                        parent,
-                        text=f"📁 {folder}",
-                        height=25,
-                        font=ctk.CTkFont(size=10),
-                        fg_color="transparent",
-                        hover_color="#404040",
-                        anchor="w",
-                        command=lambda f=folder: self.open_folder_in_explorer(f),
-                    )
-                    folder_btn.pack(fill="x", padx=5, pady=1)
-
-                    # Show some subfolders for Assets
-                    if folder == "Assets" and os.path.isdir(folder_path):
-                        try:
-                            subfolders = [
-                                d
-                                for d in os.listdir(folder_path)
-                                if os.path.isdir(os.path.join(folder_path, d))
-                            ][:5]
-                            for subfolder in subfolders:
-                                sub_btn = ctk.CTkButton(
-                                    parent,
-                                    text=f"  📂 {subfolder}",
-                                    height=20,
-                                    font=ctk.CTkFont(size=9),
-                                    fg_color="transparent",
-                                    hover_color="#404040",
-                                    anchor="w",
-                                    command=lambda sf=subfolder: self.open_subfolder_in_explorer(
-                                        sf
-                                    ),
-                                )
-                                sub_btn.pack(fill="x", padx=10, pady=1)
-                        except PermissionError:
-                            pass
+                if folder in present:
+                    self._add_tree_node(parent, present[folder], folder, 0)
         except Exception as e:
             error_label = ctk.CTkLabel(
                 parent,
                 text=f"❌ Error loading files: {str(e)[:50]}...",
-                font=ctk.CTkFont(size=9),
+                font=self._font(9),
                 text_color="#f48771",
             )
             error_label.pack(padx=5, pady=5)
 
+    def _add_tree_node(self, parent, path, name, depth):
+        """Add a collapsed folder row to the file tree"""
+        btn = ctk.CTkButton(
+            parent,
+            text=f"▶ 📁 {name}",
+            height=25 if depth == 0 else 20,
+            font=self._font(10 if depth == 0 else 9),
+            fg_color="transparent",
+            hover_color="#404040",
+            anchor="w",
+            command=lambda: self._toggle_tree_node(path),
+        )
+        btn.pack(fill="x", padx=5, pady=1)
+        self._tree_nodes[path] = {
+            "name": name,
+            "depth": depth,
+            "expanded": False,
+            "loaded": False,
+            "btn": btn,
+            "children_frame": ctk.CTkFrame(parent, fg_color="transparent"),
+        }
+
+    def _toggle_tree_node(self, path):
+        """Expand or collapse a folder row, listing it on first expand"""
+        node = self._tree_nodes.get(path)
+        if node is None:
+            return
+
+        node["expanded"] = not node["expanded"]
+        arrow = "▼" if node["expanded"] else "▶"
+        node["btn"].configure(text=f"{arrow} 📁 {node['name']}")
+
+        children_frame = node["children_frame"]
+        if not node["expanded"]:
+            children_frame.pack_forget()
+            return
+
+        children_frame.pack(fill="x", padx=(10, 0), after=node["btn"])
+        if not node["loaded"]:
+            node["loaded"] = True
+            loading_label = ctk.CTkLabel(
+                children_frame,
+                text="⏳ Đang tải...",
+                font=self._font(9),
+                text_color="#888888",
+                anchor="w",
+            )
+            loading_label.pack(fill="x", padx=5, pady=1)
+            threading.Thread(
+                target=self._list_tree_node, args=(path,), daemon=True
+            ).start()
+
+    def _list_tree_node(self, path):
+        """List a folder's subfolders on a worker thread"""
+        try:
+            # DirEntry.path is already joined; no os.path.join per child
+            with os.scandir(path) as it:
+                children = sorted(
+                    (entry.name, entry.path)
+                    for entry in it
+                    if entry.is_dir(follow_symlinks=False)
+                )
+        except OSError:
+            children = None
+        self.after(0, self._fill_tree_node, path, children)
+
+    def _fill_tree_node(self, path, children):
+        """Replace a folder's loading label with its subfolder rows"""
+        node = self._tree_nodes.get(path)
+        if node is None or not node["children_frame"].winfo_exists():
+            return  # Tree was rebuilt while listing
+
+        children_frame = node["children_frame"]
+        for child in children_frame.winfo_children():
+            child.destroy()
+
+        if not children:
+            empty_label = ctk.CTkLabel(
+                children_frame,
+                text="❌ Không thể đọc thư mục" if children is None else "(trống)",
+                font=self._font(9),
+                text_color="#888888",
+                anchor="w",
+            )
+            empty_label.pack(fill="x", padx=5, pady=1)
+            return
+
+        for name, child_path in children:
+            self._add_tree_node(children_frame, child_path, name, node["depth"] + 1)
+
     def populate_project_info(self, parent):
         """Populate project information"""
         if not self.has_project() or not self.unity_project_path:
             return
 
         project_name = self.get_project_name()
-        project_path = str(self.unity_project_path)
+        project_path = self.unity_project_path
 
         # Project name
         name_label = ctk.CTkLabel(
             parent,
             text=f"Name: {project_name}",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=self._font(10, "bold"),
             text_color="#4ec9b0",
             anchor="w",
         )
@@ -866,36 +1223,43 @@ class EditorWindow(BaseScreen):
         path_label = ctk.CTkLabel(
             parent,
             text=f"Path: {path_display}",
-            font=ctk.CTkFont(size=9),
+            font=self._font(9),
             text_color="#cccccc",
             anchor="w",
         )
         path_label.pack(fill="x", padx=5, pady=1)
 
         # Unity version (if available)
-        try:
-            import os
-
-            version_file = os.path.join(
-                project_path, "ProjectSettings", "ProjectVersion.txt"
+        version = self._read_unity_version()
+        if version:
+            version_label = ctk.CTkLabel(
+                parent,
+                text=f"Unity: {version}",
+                font=self._font(9),
+                text_color="#f48771",
+                anchor="w",
             )
-            if os.path.exists(version_file):
-                with open(version_file, "r") as f:
-                    content = f.read()
-                    if "m_EditorVersion:" in content:
-                        version = (
-                            content.split("m_EditorVersion:")[1].strip().split("\n")[0]
-                        )
-                        version_label = ctk.CTkLabel(
-                            parent,
-                            text=f"Unity: {version}",
-                            font=ctk.CTkFont(size=9),
-                            text_color="#f48771",
-                            anchor="w",
-                        )
-                        version_label.pack(fill="x", padx=5, pady=1)
-        except Exception:
-            pass
+            version_label.pack(fill="x", padx=5, pady=1)
+
+        # Size and file count (filled in once the project walk finishes)
+        size_text, files_text, _ = self.render_project_info()
+        self._project_size_label = ctk.CTkLabel(
+            parent,
+            text=f"Size: {size_text}",
+            font=self._font(9),
+            text_color="#cccccc",
+            anchor="w",
+        )
+        self._project_size_label.pack(fill="x", padx=5, pady=1)
+
+        self._project_files_label = ctk.CTkLabel(
+            parent,
+            text=f"Files: {files_text}",
+            font=self._font(9),
+            text_color="#cccccc",
+            anchor="w",
+        )
+        self._project_files_label.pack(fill="x", padx=5, pady=1)
 
         # Quick actions
         actions_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -905,7 +1269,7 @@ class EditorWindow(BaseScreen):
             actions_frame,
             text="📂 Open Folder",
             height=25,
-            font=ctk.CTkFont(size=9),
+            font=self._font(9),
             fg_color="#0e639c",
             hover_color="#1177bb",
             command=self.open_project_folder,
@@ -916,13 +1280,22 @@ class EditorWindow(BaseScreen):
             actions_frame,
             text="🎮 Open Unity",
             height=25,
-            font=ctk.CTkFont(size=9),
+            font=self._font(9),
             fg_color="#FF9800",
             hover_color="#ffaa33",
             command=self.open_in_unity,
         )
         unity_btn.pack(fill="x", pady=1)
 
+    def _refresh_project_stats_labels(self, event=None):
+        """Show newly computed project stats in the project info panel"""
+        label = self._project_size_label
+        if label is None or not label.winfo_exists():
+            return
+        size_text, files_text, _ = self.render_project_info()
+        label.configure(text=f"Size: {size_text}")
+        self._project_files_label.configure(text=f"Files: {files_text}")
+
     def open_folder_in_explorer(self, folder_name):
         """Open specific folder in file explorer"""
         self.add_output_message(f"📁 Opening {folder_name} folder...")
@@ -935,6 +1308,22 @@ class EditorWindow(BaseScreen):
 
     def refresh_layout(self):
         """Refresh the entire layout when project state changes"""
+        has = self.has_project()
+        if has == self._layout_has_project:
+            # Same layout for the new project; update its content in place
+            if has:
+                heroes_list = self.load_heroes_from_folder()
+                self._heroes_title_label.configure(text=f"HEROES ({len(heroes_list)})")
+                self.populate_simple_file_tree(self.explorer_content, heroes_list)
+                self._editor_label.configure(
+                    text=f"📝 Editor Area - {self.get_project_name()}"
+                )
+                # Re-walk the project and let the info labels re-read it
+                self._stats_cache.pop(self.unity_project_path, None)
+                self._stats_failed_path = None
+                self.event_generate("<<ProjectStatsReady>>")
+            return
+
         # Destroy all current widgets except toolbar
         for widget in self.winfo_children():
             if hasattr(widget, "grid_info") and widget.grid_info().get("row") != 0:
@@ -968,6 +1357,7 @@ class EditorWindow(BaseScreen):
         """Refresh project view"""
         if self.has_project():
             self.add_output_message("🔄 Đang làm mới dự án...")
+            self.invalidate_unity_installation()
             self.setup_ui()  # Refresh the entire UI
             self.add_output_message("✅ Đã làm mới dự án thành công")
         else:
@@ -982,60 +1372,14 @@ class EditorWindow(BaseScreen):
         self.add_output_message("   Unity Editor: Khởi động Unity Editor với dự án")
         self.add_output_message("   Phân tích: Phân tích cấu trúc dự án")
 
-    def show_file_menu(self):
-        """Show File menu dropdown"""
+    def show_menu(self, menu_name):
+        """Show the named dropdown menu from _MENUS"""
+        has = self.has_project()
         self.create_dropdown_menu(
-            "File",
+            menu_name,
             [
-                ("📁 Chọn folder Unity", self.load_existing_project),
-                (
-                    "📂 Mở thư mục dự án",
-                    self.open_project_folder if self.has_project() else None,
-                ),
-                (
-                    "🔄 Refresh dự án",
-                    self.refresh_project if self.has_project() else None,
-                ),
-                ("🗑️ Xóa dự án đã lưu", self.clear_last_project),
-            ],
-        )
-
-    def show_project_menu(self):
-        """Show Project menu dropdown"""
-        self.create_dropdown_menu(
-            "Project",
-            [
-                ("🔄 Load XAPK to Unity", self.go_to_xapk_converter),
-                (
-                    "🎮 Mở Unity Editor",
-                    self.open_in_unity if self.has_project() else None,
-                ),
-                (
-                    "🔍 Phân tích dự án",
-                    self.analyze_project if self.has_project() else None,
-                ),
-            ],
-        )
-
-    def show_tools_menu(self):
-        """Show Tools menu dropdown"""
-        self.create_dropdown_menu(
-            "Tools",
-            [
-                ("📦 Tải game (XAPK)", self.download_xapk_game),
-                ("🛠️ AssetRipper", self.show_tools_info),
-                ("📱 APK Tools", self.show_tools_info),
-            ],
-        )
-
-    def show_help_menu(self):
-        """Show Help menu dropdown"""
-        self.create_dropdown_menu(
-            "Help",
-            [
-                ("❓ Trợ giúp", self.show_help),
-                ("⚙️ Cài đặt", self.open_settings),
-                ("📋 Thông tin", self.show_about),
+                (label, getattr(self, method) if has or not needs_project else None)
+                for label, method, needs_project in self._MENUS[menu_name]
             ],
         )
 
@@ -1061,7 +1405,7 @@ class EditorWindow(BaseScreen):
         try:
             dropdown.grab_set()
         except Exception as e:
-            print(f"Warning: Could not grab window: {e}")
+            log.warning("Could not grab window: %s", e)
 
         # Dropdown content frame
         content_frame = ctk.CTkFrame(dropdown)
@@ -1071,7 +1415,7 @@ class EditorWindow(BaseScreen):
         title_label = ctk.CTkLabel(
             content_frame,
             text=f"{menu_name} Menu",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
         )
         title_label.pack(pady=(10, 15))
 
@@ -1083,7 +1427,7 @@ class EditorWindow(BaseScreen):
                     content_frame,
                     text=text,
                     height=35,
-                    font=ctk.CTkFont(size=11),
+                    font=self._font(11),
                     fg_color="#555555",
                     state="disabled",
                 )
@@ -1092,7 +1436,7 @@ class EditorWindow(BaseScreen):
                     content_frame,
                     text=text,
                     height=35,
-                    font=ctk.CTkFont(size=11),
+                    font=self._font(11),
                     command=lambda cmd=command, win=dropdown: self.execute_menu_command(
                         cmd, win
                     ),
@@ -1179,13 +1523,13 @@ class EditorWindow(BaseScreen):
         project_name = self.get_project_name()
 
         # Main editor label
-        editor_label = ctk.CTkLabel(
+        self._editor_label = ctk.CTkLabel(
             editor_area,
             text=f"📝 Editor Area - {project_name}",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font(18, "bold"),
             text_color="#ffffff",
         )
-        editor_label.grid(row=0, column=0)
+        self._editor_label.grid(row=0, column=0)
 
     def setup_welcome_screen(self, parent):
         """Create simple welcome screen without dialogs"""
@@ -1204,7 +1548,7 @@ class EditorWindow(BaseScreen):
         welcome_title = ctk.CTkLabel(
             center_frame,
             text="KingGodCastle AIO",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=self._font(32, "bold"),
             text_color="#ffffff",
         )
         welcome_title.grid(row=0, column=0, pady=(0, 10))
@@ -1213,7 +1557,7 @@ class EditorWindow(BaseScreen):
         subtitle = ctk.CTkLabel(
             center_frame,
             text="'Tôi chả hiểu sao tôi làm app này' - NOwL không nói zị",
-            font=ctk.CTkFont(size=16),
+            font=self._font(16),
             text_color="#cccccc",
         )
         subtitle.grid(row=1, column=0, pady=(0, 30))
@@ -1222,9 +1566,13 @@ class EditorWindow(BaseScreen):
         """Create VSCode-like bottom panel with resize and collapse functionality"""
         # Container for bottom panel + resize handle
         self.bottom_container = ctk.CTkFrame(parent, fg_color="transparent")
-        columnspan = 2 if self.has_project() else 1
         self.bottom_container.grid(
-            row=2, column=0, columnspan=columnspan, sticky="ew", padx=0, pady=0
+            row=2,
+            column=0,
+            columnspan=self._bottom_columnspan,
+            sticky="ew",
+            padx=0,
+            pady=0,
         )
         self.bottom_container.grid_columnconfigure(0, weight=1)
         self.bottom_container.grid_rowconfigure(0, weight=0)  # Resize handle
@@ -1271,7 +1619,7 @@ class EditorWindow(BaseScreen):
         output_tab = ctk.CTkLabel(
             tabs_frame,
             text="LOG",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=self._font(10, "bold"),
             text_color="#cccccc",
         )
         output_tab.grid(row=0, column=0, padx=10)
@@ -1282,7 +1630,7 @@ class EditorWindow(BaseScreen):
             text="▼",
             width=20,
             height=20,
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             fg_color="transparent",
             text_color="#cccccc",
             hover_color="#404040",
@@ -1300,6 +1648,7 @@ class EditorWindow(BaseScreen):
             scrollbar_button_hover_color="#4a4a4a",
         )
         self.output_text.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
+        self._output_line_count = 0
 
         # Initialize messages
         self.add_output_message("Editor khởi tạo thành công")
@@ -1317,51 +1666,66 @@ class EditorWindow(BaseScreen):
         delta = (
             self.resize_start_y - event.y_root
         )  # Inverted because we want to drag up to increase height
-        new_height = max(
+        self._pending_height = max(
             self.min_bottom_height,
             min(self.max_bottom_height, self.resize_start_height + delta),
         )
+
+        # Apply at most once per frame (~60 Hz) while dragging
+        if self._bottom_resize_after_id is None:
+            self._bottom_resize_after_id = self.after(16, self._apply_bottom_resize)
+
+    def _apply_bottom_resize(self):
+        """Apply the latest pending bottom panel height"""
+        self._bottom_resize_after_id = None
+        new_height = self._pending_height
+        if new_height is None:
+            return
+        self._pending_height = None
         self.bottom_frame.configure(height=new_height)
         self.bottom_height = new_height
 
     def stop_bottom_resize(self, event):
         """Stop resizing bottom panel"""
-        pass
+        # Commit the final height right away
+        if self._bottom_resize_after_id is not None:
+            self.after_cancel(self._bottom_resize_after_id)
+        self._apply_bottom_resize()
 
     def add_output_message(self, message):
-        """Add message to output panel"""
-        if hasattr(self, "output_text"):
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            formatted_message = f"[{timestamp}] {message}\n"
-            self.output_text.insert("end", formatted_message)
-            self.output_text.see("end")  # Auto-scroll to bottom
+        """Add message to output panel (batched into one insert per frame)"""
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        self._pending_output.append(f"[{timestamp}] {message}")
+        if self._output_flush_id is None:
+            # ~one frame, so bursts spread over several idle cycles coalesce
+            self._output_flush_id = self.after(16, self._flush_output)
+
+    def _flush_output(self):
+        """Write all pending output messages with a single insert"""
+        self._output_flush_id = None
+        if not self._pending_output or self.output_text is None:
+            return  # Kept pending until the output panel exists
+        combined = "\n".join(self._pending_output)
+        self._pending_output.clear()
+        self.output_text.insert("end", combined + "\n")
+
+        # Keep the log bounded; trim from the top in bulk, not per message
+        self._output_line_count += combined.count("\n") + 1
+        if self._output_line_count > _OUTPUT_TRIM_AT_LINES:
+            excess = self._output_line_count - _OUTPUT_MAX_LINES
+            self.output_text.delete("1.0", f"{excess + 1}.0")
+            self._output_line_count = _OUTPUT_MAX_LINES
+
+        self.output_text.see("end")  # Auto-scroll to bottom
 
     def get_hover_color(self, color):
         """Get hover color for button"""
-        hover_colors = {
-            "#0e639c": "#1177bb",
-            "#4CAF50": "#45a049",
-            "#FF9800": "#F57C00",
-            "#6c757d": "#5a6268",
-            "#2196F3": "#1976D2",
-            "#9C27B0": "#7B1FA2",
-        }
-        return hover_colors.get(color, "#37373d")
+        return self._HOVER_COLORS.get(color, "#37373d")
 
     def get_directory_size(self, path):
         """Calculate directory size in MB"""
-        total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                for file in filenames:
-                    try:
-                        file_path = os.path.join(dirpath, file)
-                        total_size += os.path.getsize(file_path)
-                    except:
-                        pass
-        except:
-            pass
-        return total_size / (1024 * 1024)  # Convert to MB
+        # The scan tallies bytes from DirEntry.stat; convert once here
+        return self._scan_subtree(path, False)[0] / (1024 * 1024)
 
     # Action methods
     def load_existing_project(self):
@@ -1374,6 +1738,7 @@ class EditorWindow(BaseScreen):
             # Check if it's a valid Unity project
             if self.is_unity_project(project_folder):
                 self.unity_project_path = project_folder
+                self._invalidate_project_cache()
 
                 # Save this project as the last opened project
                 self.save_last_project(project_folder)
@@ -1403,11 +1768,12 @@ class EditorWindow(BaseScreen):
         """Check if path is a valid Unity project"""
         # Check for ProjectSettings folder and ProjectVersion.txt
         project_settings = os.path.join(path, "ProjectSettings", "ProjectVersion.txt")
-        return os.path.exists(project_settings)
+        return os.path.isfile(project_settings)
 
     def load_project(self, project_path):
         """Load a specific project path"""
         self.unity_project_path = project_path
+        self._invalidate_project_cache()
         self.add_output_message(f"✅ Đã tải dự án: {os.path.basename(project_path)}")
         self.setup_ui()  # Refresh UI
 
@@ -1440,12 +1806,11 @@ class EditorWindow(BaseScreen):
             return
 
         try:
-            project_path = str(self.unity_project_path)
-            system = platform.system()
+            project_path = self.unity_project_path
 
-            if system == "Windows":
+            if _SYSTEM == "Windows":
                 subprocess.run(["explorer", project_path])
-            elif system == "Darwin":  # macOS
+            elif _SYSTEM == "Darwin":  # macOS
                 subprocess.run(["open", project_path])
             else:  # Linux and others
                 subprocess.run(["xdg-open", project_path])
@@ -1461,7 +1826,7 @@ class EditorWindow(BaseScreen):
             return
 
         try:
-            project_path = str(self.unity_project_path)
+            project_path = self.unity_project_path
 
             # Find Unity installation
             unity_path = self.find_unity_installation()
@@ -1474,7 +1839,7 @@ class EditorWindow(BaseScreen):
             )
 
             # Launch Unity with project
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 cmd = [unity_path, "-projectPath", project_path]
             else:
                 cmd = [unity_path, "-projectPath", project_path]
@@ -1486,17 +1851,18 @@ class EditorWindow(BaseScreen):
             self.add_output_message(f"❌ Lỗi khi mở Unity: {str(e)}")
 
     def find_unity_installation(self):
-        """Find Unity installation path"""
-        system = platform.system()
+        """Find Unity installation path (cached once found)"""
+        if self._unity_path_cache is not None:
+            return self._unity_path_cache
 
         # Common Unity installation paths
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             possible_paths = [
                 r"C:\Program Files\Unity\Hub\Editor\*\Editor\Unity.exe",
                 r"C:\Program Files\Unity\Editor\Unity.exe",
                 r"C:\Program Files (x86)\Unity\Editor\Unity.exe",
             ]
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             possible_paths = [
                 "/Applications/Unity/Hub/Editor/*/Unity.app/Contents/MacOS/Unity",
                 "/Applications/Unity/Unity.app/Contents/MacOS/Unity",
@@ -1512,105 +1878,305 @@ class EditorWindow(BaseScreen):
             matches = glob.glob(pattern)
             if matches:
                 # Return the first (usually latest) match
-                return matches[0]
+                self._unity_path_cache = matches[0]
+                return self._unity_path_cache
 
         return None
 
+    def invalidate_unity_installation(self):
+        """Forget the cached Unity installation so the next lookup re-globs"""
+        self._unity_path_cache = None
+
     def analyze_project(self):
         """Analyze Unity project structure and show statistics"""
         if not self.has_project():
             self.add_output_message("❌ Chưa chọn dự án nào để phân tích")
             return
 
+        self.add_output_message("🔍 Đang phân tích dự án...")
+
+        # Walking the tree can take seconds; keep it off the Tk thread
+        threading.Thread(
+            target=self._analyze_project_worker,
+            args=(self.unity_project_path,),
+            daemon=True,
+        ).start()
+
+    def _analyze_project_worker(self, project_path):
+        """Collect project statistics on a worker thread"""
         try:
-            project_path = str(self.unity_project_path)
-            self.add_output_message("🔍 Đang phân tích dự án...")
+            # Totals: size, scripts, prefabs, scenes, files
+            totals = [0, 0, 0, 0, 0]
+
+            skip = _PROJECT_SKIPPED_DIRS
 
-            # Analyze project structure
+            # Fast stats come from Assets alone and are shown right away
             assets_path = os.path.join(project_path, "Assets")
-            scripts_count = 0
-            prefabs_count = 0
-            scenes_count = 0
-
-            if os.path.exists(assets_path):
-                for root, dirs, files in os.walk(assets_path):
-                    for file in files:
-                        ext = os.path.splitext(file)[1].lower()
-                        if ext == ".cs":
-                            scripts_count += 1
-                        elif ext == ".prefab":
-                            prefabs_count += 1
-                        elif ext == ".unity":
-                            scenes_count += 1
-
-            # Project size
-            size_mb = self.get_directory_size(project_path)
-
-            # Unity version
-            unity_version = self.get_unity_version()
-
-            # Output analysis
-            self.add_output_message("📊 Kết quả phân tích dự án:")
-            self.add_output_message(f"   📂 Scripts (C#): {scripts_count}")
-            self.add_output_message(f"   🧩 Prefabs: {prefabs_count}")
-            self.add_output_message(f"   🎬 Scenes: {scenes_count}")
-            self.add_output_message(f"   💾 Kích thước: {size_mb:.1f} MB")
-            self.add_output_message(f"   🎮 Unity Version: {unity_version}")
+            if os.path.isdir(assets_path):
+                assets_dirs = []
+                self._add_counts(
+                    totals, self._scan_dir(assets_path, True, assets_dirs, skip)
+                )
+                self._scan_parallel(
+                    totals, assets_dirs, True, report_progress=True, skip=skip
+                )
+
+            result = {
+                "scripts": totals[1],
+                "prefabs": totals[2],
+                "scenes": totals[3],
+                "version": self.get_unity_version(),
+            }
+            self.after(0, self._render_analysis, result)
+
+            # Size follows; Assets is already counted and generated or VCS
+            # folders (Library, Temp, .git, ...) are not part of the project
+            assets_size = totals[0]
+            totals = [0, 0, 0, 0, 0]
+            root_dirs = []
+            self._add_counts(
+                totals, self._scan_dir(project_path, False, root_dirs, skip)
+            )
+            root_dirs = [entry for entry in root_dirs if entry.name != "Assets"]
+            self._scan_parallel(totals, root_dirs, False, skip=skip)
 
+            size_mb = (assets_size + totals[0]) / (1024 * 1024)
+            self.after(
+                0, self.add_output_message, f"   💾 Kích thước: {size_mb:.1f} MB"
+            )
         except Exception as e:
-            self.add_output_message(f"❌ Lỗi khi phân tích dự án: {str(e)}")
+            self.after(
+                0, self.add_output_message, f"❌ Lỗi khi phân tích dự án: {str(e)}"
+            )
+
+    def _scan_parallel(
+        self, totals, paths, in_assets, report_progress=False, skip=frozenset()
+    ):
+        """Tally independent subtrees in a thread pool and add them into totals"""
+        reported = totals[4] // 1000
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(self._scan_subtree, path, in_assets, skip)
+                for path in paths
+            ]
+            # Reduce here, on this thread only, as each subtree finishes
+            for future in as_completed(futures):
+                self._add_counts(totals, future.result())
+                if report_progress and totals[4] // 1000 > reported:
+                    reported = totals[4] // 1000
+                    self.after(
+                        0,
+                        self.add_output_message,
+                        f"   ⏳ Đã quét {totals[4]} files...",
+                    )
+
+    @staticmethod
+    def _add_counts(totals, counts):
+        """Add a (size, scripts, prefabs, scenes, files) tuple into totals"""
+        for i, value in enumerate(counts):
+            totals[i] += value
+
+    @staticmethod
+    def _scan_dir(path, in_assets, subdirs, skip=frozenset()):
+        """Tally the files directly in path and append its subdirectories
+
+        Subdirectories are appended as DirEntry objects (scandir accepts them
+        as paths); those named in skip are left out.
+        """
+        size = scripts = prefabs = scenes = files = 0
+        add_subdir = subdirs.append  # Bound once; this loop runs per file
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip:
+                            add_subdir(entry)
+                        continue
+                    # Not following links lets Windows answer from the
+                    # FindFirstFileW/FindNextFileW data scandir already read
+                    size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+
+                if in_assets:
+                    # Unity asset extensions are lowercase by convention
+                    name = entry.name
+                    if name.endswith(".cs"):
+                        scripts += 1
+                    elif name.endswith(".prefab"):
+                        prefabs += 1
+                    elif name.endswith(".unity"):
+                        scenes += 1
+                files += 1
+        return size, scripts, prefabs, scenes, files
+
+    @classmethod
+    def _scan_subtree(cls, path, in_assets, skip=frozenset()):
+        """Tally a whole subtree, skipping directories that cannot be read"""
+        totals = [0, 0, 0, 0, 0]
+        stack = [path]
+        while stack:
+            children = []
+            try:
+                counts = cls._scan_dir(stack.pop(), in_assets, children, skip)
+            except OSError:
+                continue
+            cls._add_counts(totals, counts)
+            if _ORDER_BY_INODE:
+                # Pushed in descending order so siblings are visited ascending
+                children.sort(key=_entry_inode, reverse=True)
+            stack.extend(children)
+        return totals
+
+    def _render_analysis(self, result):
+        """Write analyze_project results to the output panel"""
+        self.add_output_message("📊 Kết quả phân tích dự án:")
+        self.add_output_message(f"   📂 Scripts (C#): {result['scripts']}")
+        self.add_output_message(f"   🧩 Prefabs: {result['prefabs']}")
+        self.add_output_message(f"   🎬 Scenes: {result['scenes']}")
+        self.add_output_message(f"   🎮 Unity Version: {result['version']}")
+        self.add_output_message("   ⏳ Đang tính kích thước...")
 
     def get_unity_version(self):
         """Get Unity version from ProjectVersion.txt"""
+        return self._read_unity_version() or "Không xác định"
+
+    def _read_unity_version(self):
+        """Parse m_EditorVersion, cached until ProjectVersion.txt changes"""
         try:
-            project_path = str(self.unity_project_path)
             version_file = os.path.join(
-                project_path, "ProjectSettings", "ProjectVersion.txt"
+                self.unity_project_path, "ProjectSettings", "ProjectVersion.txt"
             )
+            key = (version_file, os.stat(version_file).st_mtime_ns)
+            if key in self._version_cache:
+                return self._version_cache[key]
+
+            with open(version_file, "r", encoding="utf-8") as f:
+                content = f.read()
+            # Extract version from "m_EditorVersion: 2022.3.0f1"
+            _, _, tail = content.partition("m_EditorVersion:")
+            version = tail.split("\n", 1)[0].strip() if tail else None
+        except (OSError, TypeError, ValueError):
+            return None
+
+        self._version_cache[key] = version
+        return version
+
+    def render_project_info(self):
+        """Return (size, files count, Unity version) texts from one stats lookup"""
+        if not self.has_project():
+            return ("N/A",) * 3
 
-            if os.path.exists(version_file):
-                with open(version_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    # Extract version from "m_EditorVersion: 2022.3.0f1"
-                    for line in content.split("\n"):
-                        if line.startswith("m_EditorVersion:"):
-                            return line.split(":", 1)[1].strip()
-        except:
-            pass
-        return "Không xác định"
+        # The version is a cached file read; only the walk results can be pending
+        version = self.get_unity_version()
+        try:
+            stats = self._project_stats()
+        except OSError:
+            return "Không xác định", "Không xác định", version
+        if stats is None:
+            if self._stats_failed_path == self.unity_project_path:
+                return "Không xác định", "Không xác định", version
+            return "⏳ Đang tính...", "⏳ Đang tính...", version
+
+        size_mb = stats[0] / (1024 * 1024)
+        if size_mb < 1000:
+            size_text = _FMT_MB(size_mb)
+        else:
+            size_text = _FMT_GB(size_mb / 1024)
+        return size_text, _FMT_COUNT(stats[1]), version
 
     def get_project_size_text(self):
         """Get project size as formatted text"""
-        if not self.has_project():
-            return "N/A"
-
-        try:
-            size_mb = self.get_directory_size(str(self.unity_project_path))
-            if size_mb < 1000:
-                return f"{size_mb:.1f} MB"
-            else:
-                return f"{size_mb/1024:.1f} GB"
-        except:
-            return "Không xác định"
+        return self.render_project_info()[0]
 
     def get_files_count_text(self):
         """Get total files count as text"""
-        if not self.has_project():
-            return "N/A"
-
-        try:
-            project_path = str(self.unity_project_path)
-            total_files = sum([len(files) for r, d, files in os.walk(project_path)])
-            return f"{total_files:,}"
-        except:
-            return "Không xác định"
+        return self.render_project_info()[1]
 
     def get_unity_version_text(self):
         """Get Unity version text"""
-        if not self.has_project():
-            return "N/A"
+        return self.render_project_info()[2]
+
+    @staticmethod
+    def _is_network_path(path):
+        """Guess whether path is on a network or synced mount"""
+        if path.startswith(("\\\\", "//", "/mnt/")):
+            return True
+        return path.startswith(os.path.join(os.path.expanduser("~"), "OneDrive"))
+
+    def _project_stats(self):
+        """Return cached project stats, or None while a worker computes them
+
+        <<ProjectStatsReady>> is generated on this screen once they are in.
+        """
+        path = self.unity_project_path
+        stats = self._fresh_project_stats(path)
+        if (
+            stats is None
+            and not self._stats_pending
+            and path != self._stats_failed_path
+        ):
+            self._stats_pending = True
+            threading.Thread(
+                target=self._project_stats_worker, args=(path,), daemon=True
+            ).start()
+        return stats
+
+    def _project_stats_worker(self, path):
+        """Walk the project on a worker thread and hand the result to the UI"""
+        entry = None
+        try:
+            entry = self._collect_project_stats(path)
+        except OSError as e:
+            log.warning("Could not collect project stats: %s", e)
+        finally:
+            self.after(0, self._on_project_stats_ready, path, entry)
+
+    def _on_project_stats_ready(self, path, entry):
+        """Cache stats for the current project and let widgets re-read them"""
+        self._stats_pending = False
+        if path == self.unity_project_path:
+            if entry is None:
+                # Listeners show the failure instead of waiting forever
+                self._stats_failed_path = path
+            else:
+                self._stats_cache[path] = entry
+        # Otherwise the project changed mid-walk; the stale result is dropped
+        # and listeners re-read, starting a walk of the current project
+        self.event_generate("<<ProjectStatsReady>>")
+
+    def _fresh_project_stats(self, path):
+        """Return cached stats for path if the root is unchanged and recent"""
+        cached = self._stats_cache.get(path)
+        if cached is None:
+            return None
+        mtime = os.stat(path).st_mtime_ns
+        if cached[0] == mtime and time.monotonic() - cached[2] < _PROJECT_STATS_TTL:
+            return cached[1]
+        return None
 
-        return self.get_unity_version()
+    def _collect_project_stats(self, path):
+        """Return (root mtime, (size bytes, file count), time) from one walk
+
+        Regenerated folders (Library, Temp, ...) are skipped at any depth.
+        Runs on a worker thread, so it touches nothing but path.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        now = time.monotonic()
+
+        # Only sizes and counts are needed, so walk with bytes paths and skip
+        # decoding every entry name
+        root = os.fsencode(path)
+        skip = _PROJECT_SKIPPED_DIRS_BYTES
+        if self._is_network_path(path):
+            # Per-directory latency dominates on shares; overlap the subtrees
+            totals = [0, 0, 0, 0, 0]
+            subdirs = []
+            self._add_counts(totals, self._scan_dir(root, False, subdirs, skip))
+            self._scan_parallel(totals, subdirs, False, skip=skip)
+        else:
+            totals = self._scan_subtree(root, False, skip)
+        return mtime, (totals[0], totals[4]), now
 
     def open_tools(self):
         """Open Unity tools or show tools menu"""
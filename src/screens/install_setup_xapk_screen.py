@@ -5,15 +5,92 @@ Screen for installing and selecting XAPK files
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
+import collections
+import datetime
+import functools
 import os
 import subprocess
 import threading
 import platform
+import re
+import time
 from pathlib import Path
 from PIL import Image, ImageDraw
 from .base_screen import BaseScreen
 from src.utils import *
 
+# King God Castle package on the Play Store
+KGC_PACKAGE = "com.awesomepiece.castle"
+
+# Seconds an apkeep version listing is reused before asking again
+VERSIONS_TTL = 600
+
+# Dropdown choices offered when apkeep cannot list versions
+FALLBACK_VERSIONS = ["latest", "159.0.02", "158.1.03", "157.1.00"]
+
+# Version numbers in apkeep's "| 159.0.02, 158.1.03, ... |" listing, matched on
+# the raw bytes so the output never has to be decoded
+_VERSION_RE = re.compile(rb"\b\d+\.\d+(?:\.\d+)*\b")
+
+
+@functools.lru_cache(maxsize=8)
+def _fetch_versions_cached(package_name):
+    """Run `apkeep -l` for package_name and return (fetched_at, versions)"""
+    result = subprocess.run(
+        ["apkeep", "-a", package_name, "-l", "."],
+        capture_output=True,
+        timeout=30,
+    )
+    if result.returncode != 0:
+        # Raising keeps failures out of the cache
+        stderr = result.stderr.decode("utf-8", "replace")
+        raise RuntimeError(f"apkeep error: {stderr.strip()[:100]}")
+
+    # Parse version list from output, de-duplicated in order
+    # No "latest" - only real versions
+    versions = tuple(
+        v.decode("ascii") for v in dict.fromkeys(_VERSION_RE.findall(result.stdout))
+    )
+
+    return time.monotonic(), versions
+
+
+def fetch_versions(package_name):
+    """Return apkeep's versions for package_name, cached for VERSIONS_TTL"""
+    fetched_at, versions = _fetch_versions_cached(package_name)
+    if time.monotonic() - fetched_at > VERSIONS_TTL:
+        _fetch_versions_cached.cache_clear()
+        _, versions = _fetch_versions_cached(package_name)
+    return list(versions)
+
+
+@functools.lru_cache(maxsize=32)
+def _font(size, weight="normal", family=None):
+    """Return a shared CTkFont; only call once the Tk root exists"""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+@functools.lru_cache(maxsize=4)
+def _circular_mask(size):
+    """Return an L-mode mask with a filled circle of the given size"""
+    mask = Image.new("L", (size, size), 0)
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((0, 0, size, size), fill=255)
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _get_circular_favicon(path, size):
+    """Return the image at path resized to size and clipped to a circle"""
+    favicon_image = Image.open(path)
+    favicon_image = favicon_image.resize((size, size), Image.Resampling.LANCZOS)
+
+    # Apply mask to make image circular; putalpha replaces the alpha outright,
+    # so converting in place matches pasting onto a transparent canvas
+    output = favicon_image.convert("RGBA")
+    output.putalpha(_circular_mask(size))
+    return output
+
 
 class XAPKInstallScreen(BaseScreen):
     """King God Castle Download Screen with integrated tools"""
@@ -24,10 +101,14 @@ class XAPKInstallScreen(BaseScreen):
         self.selected_file = None
         self.processing = False
 
-        # Version caching
-        self.cached_versions = {}
+        # Pending log lines, written to log_display in one batch per flush
+        self._log_queue = collections.deque()
+        self._log_flush_scheduled = False
+
+        # Version caching (apkeep listings are cached by fetch_versions)
         self.package_info_cache = {}
-        self.versions_loading = False
+        # Set while an apkeep listing runs so overlapping refreshes coalesce
+        self.versions_loading = threading.Event()
 
         self.tools = ToolsManager()
         self.cfg: ConfigManager = ConfigManager()
@@ -60,22 +141,25 @@ class XAPKInstallScreen(BaseScreen):
             elif event.num == 5 or event.delta < 0:
                 self.main_container._parent_canvas.yview_scroll(1, "units")
 
-        # Windows/MacOS
-        self.main_container.bind_all("<MouseWheel>", _on_mousewheel)
-        # Linux (button 4/5)
-        self.main_container.bind_all("<Button-4>", _on_mousewheel)
-        self.main_container.bind_all("<Button-5>", _on_mousewheel)
+            return "break"
+
+        # The handler lives on a bind tag of its own that only this screen's
+        # widgets carry, so other scrollable frames keep their wheel bindings
+        self._wheel_tag = f"XAPKWheel{id(self)}"
+        for sequence in (
+            "<MouseWheel>",  # Windows/MacOS
+            "<Button-4>",  # Linux (button 4/5)
+            "<Button-5>",
+        ):
+            self.bind_class(self._wheel_tag, sequence, _on_mousewheel)
+        self._add_wheel_tag(self.main_container._parent_canvas)
 
-        # Create sections
+        # Create above-the-fold sections; the rest follow on the next idle tick
         self.create_hero_section()
         self.create_action_section()
-        self.create_status_section()
-        self.create_logs_section()
 
         # Initialize data
-        self.tools_status = self.tools.check_tools()
         self.processing = False
-        self.versions_loading = False
 
         # Create dummy attributes for backward compatibility
         class MockLabel:
@@ -85,6 +169,27 @@ class XAPKInstallScreen(BaseScreen):
         self.file_status_label = MockLabel()
         self.process_status_label = MockLabel()
 
+        self._add_wheel_tag(self.main_container)
+        self.after_idle(self._build_deferred)
+
+    def _add_wheel_tag(self, widget):
+        """Route wheel events over widget and its children to main_container"""
+        # Text boxes scroll their own content
+        if isinstance(widget, ctk.CTkTextbox):
+            return
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            # After the widget's own class, before toplevel and "all"
+            widget.bindtags(tags[:2] + (self._wheel_tag,) + tags[2:])
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    def _build_deferred(self):
+        """Create the status and logs sections after the first paint"""
+        self.create_status_section()
+        self.create_logs_section()
+        self._add_wheel_tag(self.main_container)
+
         # Initialize logging and load versions
         self.initialize_logging()
         self.after(100, self.auto_refresh_versions)
@@ -120,23 +225,10 @@ class XAPKInstallScreen(BaseScreen):
         # Load favicon.ico as icon
         try:
             favicon_path = os.path.join(os.getcwd(), "assets", "favicon.ico")
-            favicon_image = Image.open(favicon_path)
 
-            # Create circular mask to prevent overflow
+            # Circular icon to prevent overflow, built once per process
             icon_size = 90  # Safe size for 120px frame with 3px border
-            favicon_image = favicon_image.resize(
-                (icon_size, icon_size), Image.Resampling.LANCZOS
-            )
-
-            # Create circular mask
-            mask = Image.new("L", (icon_size, icon_size), 0)
-            draw = ImageDraw.Draw(mask)
-            draw.ellipse((0, 0, icon_size, icon_size), fill=255)
-
-            # Apply mask to make image circular
-            output = Image.new("RGBA", (icon_size, icon_size), (0, 0, 0, 0))
-            output.paste(favicon_image, (0, 0))
-            output.putalpha(mask)
+            output = _get_circular_favicon(favicon_path, icon_size)
 
             favicon_ctk = ctk.CTkImage(output, size=(icon_size, icon_size))
 
@@ -150,7 +242,7 @@ class XAPKInstallScreen(BaseScreen):
             # Fallback to emoji if favicon can't be loaded
             print(f"Could not load favicon.ico: {e}")
             castle_icon = ctk.CTkLabel(
-                icon_frame, text="🏰", font=ctk.CTkFont(size=42), fg_color="transparent"
+                icon_frame, text="🏰", font=_font(42), fg_color="transparent"
             )
 
         castle_icon.place(relx=0.5, rely=0.5, anchor="center")
@@ -163,7 +255,7 @@ class XAPKInstallScreen(BaseScreen):
         title_label = ctk.CTkLabel(
             content_frame,
             text="King God Castle",
-            font=ctk.CTkFont(size=36, weight="bold"),
+            font=_font(36, "bold"),
             text_color=("#3d5afe", "#58a6ff"),
             anchor="w",
         )
@@ -172,7 +264,7 @@ class XAPKInstallScreen(BaseScreen):
         subtitle_label = ctk.CTkLabel(
             content_frame,
             text="APK Processor & Asset Extractor",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color=("#ffffff", "#e6edf3"),
             anchor="w",
         )
@@ -193,7 +285,7 @@ class XAPKInstallScreen(BaseScreen):
         status_label = ctk.CTkLabel(
             content_frame,
             text=f"Status: {status_text}",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=status_color,
             anchor="w",
         )
@@ -217,7 +309,7 @@ class XAPKInstallScreen(BaseScreen):
         header_frame.grid_columnconfigure(1, weight=1)
         header_frame.grid_propagate(False)
 
-        download_icon = ctk.CTkLabel(header_frame, text="📥", font=ctk.CTkFont(size=28))
+        download_icon = ctk.CTkLabel(header_frame, text="📥", font=_font(28))
         download_icon.grid(row=0, column=0, padx=(0, 20))
 
         header_text_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
@@ -226,7 +318,7 @@ class XAPKInstallScreen(BaseScreen):
         action_title = ctk.CTkLabel(
             header_text_frame,
             text="Download Game",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=_font(22, "bold"),
             anchor="w",
         )
         action_title.pack(anchor="w")
@@ -234,7 +326,7 @@ class XAPKInstallScreen(BaseScreen):
         action_subtitle = ctk.CTkLabel(
             header_text_frame,
             text="Select version and download King God Castle APK",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=("#64748b", "#7d8590"),
             anchor="w",
         )
@@ -249,7 +341,7 @@ class XAPKInstallScreen(BaseScreen):
         version_label = ctk.CTkLabel(
             controls_frame,
             text="Game Version:",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             width=120,
         )
         version_label.grid(row=0, column=0, sticky="w", pady=(0, 20))
@@ -260,8 +352,8 @@ class XAPKInstallScreen(BaseScreen):
             values=["🔄 Loading latest versions..."],
             height=50,
             width=300,
-            font=ctk.CTkFont(size=14),
-            dropdown_font=ctk.CTkFont(size=13),
+            font=_font(14),
+            dropdown_font=_font(13),
             state="readonly",
             corner_radius=12,
             border_width=2,
@@ -283,7 +375,7 @@ class XAPKInstallScreen(BaseScreen):
             command=self.download_apk_by_package,
             height=50,
             width=160,
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=_font(15, "bold"),
             fg_color=("#00d084", "#2ea043"),
             hover_color=("#00b370", "#2d9f39"),
             corner_radius=12,
@@ -328,7 +420,7 @@ class XAPKInstallScreen(BaseScreen):
         tools_title = ctk.CTkLabel(
             tools_frame,
             text="🔧 Tools Status",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             anchor="w",
         )
         tools_title.pack(anchor="w", pady=(0, 15))
@@ -366,7 +458,7 @@ class XAPKInstallScreen(BaseScreen):
             tool_header = ctk.CTkLabel(
                 tool_content,
                 text=f"{status_icon} {tool_name} - {status_text}",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=_font(14, "bold"),
                 text_color=status_color,
                 anchor="w",
             )
@@ -375,7 +467,7 @@ class XAPKInstallScreen(BaseScreen):
             tool_description = ctk.CTkLabel(
                 tool_content,
                 text=tool_desc,
-                font=ctk.CTkFont(size=12),
+                font=_font(12),
                 text_color=("#64748b", "#7d8590"),
                 anchor="w",
             )
@@ -388,7 +480,7 @@ class XAPKInstallScreen(BaseScreen):
         files_title = ctk.CTkLabel(
             files_frame,
             text="📁 File Operations",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             anchor="w",
         )
         files_title.pack(anchor="w", pady=(0, 15))
@@ -402,7 +494,7 @@ class XAPKInstallScreen(BaseScreen):
             text="📂 Select XAPK File",
             command=self.select_file,
             height=40,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=_font(13, "bold"),
             fg_color=("#6366f1", "#8b5cf6"),
             hover_color=("#5b21b6", "#7c3aed"),
             corner_radius=10,
@@ -414,7 +506,7 @@ class XAPKInstallScreen(BaseScreen):
             text="🔄 Process XAPK",
             command=self.process_files,
             height=40,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=_font(13, "bold"),
             fg_color=("#f59e0b", "#f97316"),
             hover_color=("#d97706", "#ea580c"),
             corner_radius=10,
@@ -437,7 +529,7 @@ class XAPKInstallScreen(BaseScreen):
         self.files_display = ctk.CTkTextbox(
             files_display_frame,
             height=100,
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             fg_color="transparent",
         )
         self.files_display.pack(fill="both", expand=True, padx=10, pady=10)
@@ -466,13 +558,13 @@ class XAPKInstallScreen(BaseScreen):
         logs_header.grid_columnconfigure(1, weight=1)
         logs_header.grid_propagate(False)
 
-        logs_icon = ctk.CTkLabel(logs_header, text="📝", font=ctk.CTkFont(size=24))
+        logs_icon = ctk.CTkLabel(logs_header, text="📝", font=_font(24))
         logs_icon.grid(row=0, column=0, padx=(0, 15))
 
         logs_title = ctk.CTkLabel(
             logs_header,
             text="Activity Log",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=_font(20, "bold"),
             anchor="w",
         )
         logs_title.grid(row=0, column=1, sticky="ew")
@@ -484,7 +576,7 @@ class XAPKInstallScreen(BaseScreen):
             command=self.clear_logs,
             height=32,
             width=80,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             fg_color=("#64748b", "#6e7681"),
             hover_color=("#475569", "#545d68"),
             corner_radius=8,
@@ -504,7 +596,7 @@ class XAPKInstallScreen(BaseScreen):
         self.log_display = ctk.CTkTextbox(
             log_container,
             height=200,
-            font=ctk.CTkFont(size=12, family="monospace"),
+            font=_font(12, family="monospace"),
             fg_color="transparent",
         )
         self.log_display.pack(fill="both", expand=True, padx=15, pady=15)
@@ -512,6 +604,7 @@ class XAPKInstallScreen(BaseScreen):
     def clear_logs(self):
         """Clear the activity log"""
         if hasattr(self, "log_display"):
+            self._log_queue.clear()
             self.log_display.configure(state="normal")
             self.log_display.delete("1.0", "end")
             self.log_display.configure(state="disabled")
@@ -536,13 +629,25 @@ class XAPKInstallScreen(BaseScreen):
         if not hasattr(self, "log_display"):
             return
 
-        import datetime
-
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(50, self._flush_logs)
+
+    def _flush_logs(self):
+        """Write every queued log line to log_display with a single insert"""
+        self._log_flush_scheduled = False
+
+        entries = []
+        while self._log_queue:
+            entries.append(self._log_queue.popleft())
+        if not entries:
+            return
 
         self.log_display.configure(state="normal")
-        self.log_display.insert("end", log_entry)
+        self.log_display.insert("end", "".join(entries))
         self.log_display.configure(state="disabled")
         self.log_display.see("end")
 
@@ -551,34 +656,6 @@ class XAPKInstallScreen(BaseScreen):
         self.add_log_message("🔄 Loading King God Castle versions...")
         self.refresh_versions()
 
-    def create_status_indicators(self, parent):
-        """Create modern status indicators"""
-        parent.grid_columnconfigure((0, 1), weight=1)
-
-        # apkeep status
-        apkeep_color = "#4CAF50" if self.tools_status.get("apkeep") else "#F44336"
-        apkeep_indicator = ctk.CTkFrame(
-            parent, fg_color=apkeep_color, height=8, width=80
-        )
-        apkeep_indicator.grid(row=0, column=0, padx=2, pady=(5, 2), sticky="ew")
-
-        apkeep_label = ctk.CTkLabel(
-            parent, text="APKeep", font=ctk.CTkFont(size=9), text_color="#B0B0B0"
-        )
-        apkeep_label.grid(row=1, column=0, padx=2)
-
-        # assetripper status
-        ripper_color = "#4CAF50" if self.tools_status.get("asset-ripper") else "#F44336"
-        ripper_indicator = ctk.CTkFrame(
-            parent, fg_color=ripper_color, height=8, width=80
-        )
-        ripper_indicator.grid(row=0, column=1, padx=2, pady=(5, 2), sticky="ew")
-
-        ripper_label = ctk.CTkLabel(
-            parent, text="AssetRipper", font=ctk.CTkFont(size=9), text_color="#B0B0B0"
-        )
-        ripper_label.grid(row=1, column=1, padx=2)
-
     def on_version_selected(self, choice):
         """Handle version selection from dropdown with enhanced feedback"""
         if choice and choice not in ["Loading versions...", "Loading..."]:
@@ -598,242 +675,6 @@ class XAPKInstallScreen(BaseScreen):
                 lambda: self.version_dropdown.configure(border_color=original_color),
             )
 
-    def load_dropdown_versions(self):
-        """Load versions into dropdown using apkeep command"""
-        package_name = "com.awesomepiece.castle"
-
-        try:
-            # Set dropdown to loading state
-            self.version_dropdown.configure(values=["latest", "🔄 Loading..."])
-            self.version_dropdown.set("🔄 Loading...")
-
-            # Run apkeep command to get versions
-            result = subprocess.run(
-                ["apkeep", "-a", package_name, "-l", "."],
-                capture_output=True,
-                text=True,
-                timeout=30,  # 30 second timeout
-            )
-
-            if result.returncode == 0:
-                # Parse version list from output
-                version_lines = result.stdout.strip().split("\n")
-                versions = []  # No "latest" - only real versions
-
-                # Look for the line with versions (contains |)
-                for line in version_lines:
-                    line = line.strip()
-                    if "|" in line and any(c.isdigit() for c in line):
-                        # Extract versions from table format "| version1, version2, ... |"
-                        version_part = line.replace("|", "").strip()
-                        if version_part:
-                            # Split by comma and clean each version
-                            for v in version_part.split(","):
-                                v = v.strip()
-                                # Validate version format (contains digits and dots)
-                                if v and any(c.isdigit() for c in v) and "." in v:
-                                    if v not in versions:
-                                        versions.append(v)
-
-                # Limit to reasonable number (15 real versions only)
-                if len(versions) > 15:
-                    versions = versions[:15]
-
-                # Update dropdown with versions
-                self.version_dropdown.configure(values=versions)
-                # Set to newest version (first in list) instead of "latest"
-                if versions:
-                    self.version_dropdown.set(versions[0])
-                self.add_log_message(f"✅ Loaded {len(versions)} versions from apkeep")
-
-            else:
-                # Error case - use some default versions (no "latest")
-                default_versions = ["159.0.02", "158.1.03", "157.1.00"]
-                self.version_dropdown.configure(values=default_versions)
-                self.version_dropdown.set(default_versions[0])
-                self.add_log_message(f"⚠️ apkeep error: {result.stderr.strip()[:100]}")
-
-        except subprocess.TimeoutExpired:
-            default_versions = ["159.0.02", "158.1.03", "157.1.00"]
-            self.version_dropdown.configure(values=default_versions)
-            self.version_dropdown.set(default_versions[0])
-            self.add_log_message("⚠️ apkeep timeout - using default versions")
-
-        except Exception as e:
-            default_versions = ["159.0.02", "158.1.03", "157.1.00"]
-            self.version_dropdown.configure(values=default_versions)
-            self.version_dropdown.set(default_versions[0])
-            self.add_log_message(f"⚠️ Version loading error: {str(e)[:100]}")
-
-    def create_file_operations_card(self, parent):
-        """Create file operations card"""
-        card = ctk.CTkFrame(parent, corner_radius=16)
-        card.grid(
-            row=1, column=0, sticky="nsew", padx=(0, 10), pady=(0, 20)
-        )  # Changed row to 1
-        card.grid_columnconfigure(0, weight=1)
-        card.grid_rowconfigure(2, weight=1)
-
-        # Card header
-        header = ctk.CTkLabel(
-            card,
-            text="📁 File Operations",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            anchor="w",
-        )
-        header.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 15))
-
-        # File selection buttons
-        buttons_frame = ctk.CTkFrame(card, fg_color="transparent")
-        buttons_frame.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 10))
-        buttons_frame.grid_columnconfigure((0, 1), weight=1)
-
-        select_file_btn = ctk.CTkButton(
-            buttons_frame,
-            text="📂 Select Files",
-            command=self.select_file,
-            height=45,
-            font=ctk.CTkFont(size=12, weight="bold"),
-            fg_color="#9C27B0",
-            hover_color="#7B1FA2",
-            corner_radius=10,
-        )
-        select_file_btn.grid(row=0, column=0, columnspan=2, sticky="ew")
-
-        # REMOVED: Folder selection button - single file mode only
-        # select_folder_btn = ctk.CTkButton(
-        #     buttons_frame,
-        #     text="📁 Select Folder",
-        #     command=self.select_folder,
-        #     height=45,
-        #     font=ctk.CTkFont(size=12, weight="bold"),
-        #     fg_color="#673AB7",
-        #     hover_color="#512DA8",
-        #     corner_radius=10,
-        # )
-        # select_folder_btn.grid(row=0, column=1, padx=(5, 0), sticky="ew")
-
-        # Selected files display
-        self.files_display = ctk.CTkTextbox(
-            card,
-            height=120,
-            font=ctk.CTkFont(family="Consolas", size=10),
-            corner_radius=10,
-        )
-        self.files_display.grid(row=2, column=0, sticky="nsew", padx=20, pady=(0, 10))
-
-        # Process button
-        self.process_btn = ctk.CTkButton(
-            card,
-            text="🔧 Process Selected Files",
-            command=self.process_files,
-            height=50,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="#FF5722",
-            hover_color="#E64A19",
-            corner_radius=12,
-            state="disabled",
-        )
-        self.process_btn.grid(row=3, column=0, sticky="ew", padx=20, pady=(0, 20))
-
-    def create_tools_status_card(self, parent):
-        """Create tools status card"""
-        card = ctk.CTkFrame(parent, corner_radius=16)
-        card.grid(row=0, column=1, sticky="ew", padx=(10, 0), pady=(0, 20))
-
-        # Card header
-        header = ctk.CTkLabel(
-            card,
-            text="🔧 Tools Status",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            anchor="w",
-        )
-        header.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 15))
-
-        # Status items
-        status_frame = ctk.CTkFrame(card, fg_color="transparent")
-        status_frame.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 20))
-        status_frame.grid_columnconfigure(1, weight=1)
-
-        # APKeep status
-        apkeep_status = "✅ Ready" if self.tools_status.get("apkeep") else "❌ Missing"
-        apkeep_color = "#4CAF50" if self.tools_status.get("apkeep") else "#F44336"
-
-        apkeep_icon = ctk.CTkLabel(status_frame, text="📦", font=ctk.CTkFont(size=20))
-        apkeep_icon.grid(row=0, column=0, padx=(0, 10), pady=5)
-
-        apkeep_info = ctk.CTkLabel(
-            status_frame,
-            text=f"APKeep\n{apkeep_status}",
-            font=ctk.CTkFont(size=12),
-            text_color=apkeep_color,
-            anchor="w",
-        )
-        apkeep_info.grid(row=0, column=1, sticky="ew", pady=5)
-
-        # AssetRipper status
-        ripper_status = (
-            "✅ Ready" if self.tools_status.get("asset-ripper") else "❌ Missing"
-        )
-        ripper_color = "#4CAF50" if self.tools_status.get("asset-ripper") else "#F44336"
-
-        ripper_icon = ctk.CTkLabel(status_frame, text="🔧", font=ctk.CTkFont(size=20))
-        ripper_icon.grid(row=1, column=0, padx=(0, 10), pady=5)
-
-        ripper_info = ctk.CTkLabel(
-            status_frame,
-            text=f"AssetRipper\n{ripper_status}",
-            font=ctk.CTkFont(size=12),
-            text_color=ripper_color,
-            anchor="w",
-        )
-        ripper_info.grid(row=1, column=1, sticky="ew", pady=5)
-
-    def create_activity_log_card(self, parent):
-        """Create activity log card"""
-        card = ctk.CTkFrame(parent, corner_radius=16)
-        card.grid(row=1, column=1, rowspan=2, sticky="nsew", padx=(10, 0), pady=(0, 20))
-        card.grid_columnconfigure(0, weight=1)
-        card.grid_rowconfigure(1, weight=1)
-
-        # Card header with clear button
-        header_frame = ctk.CTkFrame(card, fg_color="transparent")
-        header_frame.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 15))
-        header_frame.grid_columnconfigure(0, weight=1)
-
-        header = ctk.CTkLabel(
-            header_frame,
-            text="📝 Activity Log",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            anchor="w",
-        )
-        header.grid(row=0, column=0, sticky="ew")
-
-        clear_btn = ctk.CTkButton(
-            header_frame,
-            text="🗑️",
-            command=self.clear_log,
-            width=40,
-            height=30,
-            font=ctk.CTkFont(size=12),
-            fg_color="#666666",
-            hover_color="#777777",
-            corner_radius=6,
-        )
-        clear_btn.grid(row=0, column=1, padx=(10, 0))
-
-        # Log display
-        self.log_textbox = ctk.CTkTextbox(
-            card,
-            font=ctk.CTkFont(family="Consolas", size=10),
-            state="disabled",
-            corner_radius=10,
-        )
-        self.log_textbox.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
-
-        # Initialize log
-        self.initialize_log()
-
     # File operation methods for the new UI
     def select_file(self):
         """Select single XAPK file for processing"""
@@ -1024,12 +865,12 @@ class XAPKInstallScreen(BaseScreen):
 
     def refresh_versions(self):
         """Refresh available versions from apkeep with enhanced UI feedback"""
-        if self.versions_loading:
+        if self.versions_loading.is_set():
             self.add_log_message("⏳ Still loading versions, please wait...")
             return
 
         self.add_log_message("🔄 Refreshing version list from apkeep...")
-        self.versions_loading = True
+        self.versions_loading.set()
 
         # Update UI to show loading state
         if hasattr(self, "version_dropdown"):
@@ -1037,62 +878,37 @@ class XAPKInstallScreen(BaseScreen):
             self.version_dropdown.set("🔄 Loading versions...")
 
         # Start background thread to fetch versions
-        def fetch_worker():
-            try:
-                package_name = "com.awesomepiece.castle"
-
-                # Run apkeep command to get versions
-                result = subprocess.run(
-                    ["apkeep", "-a", package_name, "-l", "."],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-
-                if result.returncode == 0:
-                    # Parse version list from output
-                    version_lines = result.stdout.strip().split("\n")
-                    versions = []  # No "latest" - only real versions
-
-                    # Look for the line with versions (contains |)
-                    for line in version_lines:
-                        line = line.strip()
-                        if "|" in line and any(c.isdigit() for c in line):
-                            # Extract versions from table format "| version1, version2, ... |"
-                            version_part = line.replace("|", "").strip()
-                            if version_part:
-                                # Split by comma and clean each version
-                                for v in version_part.split(","):
-                                    v = v.strip()
-                                    # Validate version format (contains digits and dots)
-                                    if v and any(c.isdigit() for c in v) and "." in v:
-                                        if v not in versions:
-                                            versions.append(v)
-
-                    versions = sorted(versions, reverse=True)  # Sort newest first
-
-                    # Update UI on main thread
-                    self.after(100, lambda: self.versions_fetch_completed(versions))
-
-                else:
-                    # Error - use default versions (no "latest")
-                    self.after(
-                        100,
-                        lambda: self.versions_fetch_completed([]),
-                    )
-
-            except Exception as e:
-                self.add_log_message(f"❌ Error refreshing versions: {str(e)[:100]}")
-                self.after(
-                    100,
-                    lambda: self.versions_fetch_completed([]),
-                )
+        threading.Thread(target=self._load_versions_worker, daemon=True).start()
 
-        threading.Thread(target=fetch_worker, daemon=True).start()
+    def _load_versions_worker(self):
+        """Run apkeep off the UI thread and hand the result to _apply_versions"""
+        versions, error = [], None
+        try:
+            # Run apkeep command to get versions (cached for VERSIONS_TTL)
+            versions = fetch_versions(KGC_PACKAGE)
+            versions = sorted(versions, reverse=True)  # Sort newest first
+        except RuntimeError as e:
+            error = str(e)
+        except subprocess.TimeoutExpired:
+            error = "apkeep timeout"
+        except Exception as e:
+            error = f"Error refreshing versions: {str(e)[:100]}"
+
+        # Update UI on main thread
+        self.after(0, self._apply_versions, versions, error)
+
+    def _apply_versions(self, versions, error=None):
+        """Show fetched versions in the dropdown (UI thread only)"""
+        self.versions_loading.clear()
+        if error is not None:
+            self.add_log_message(f"❌ {error}")
+            self.add_log_message("⚠️ Using default versions")
+            # Error - fall back to "latest" and the last known versions
+            if hasattr(self, "version_dropdown"):
+                self.version_dropdown.configure(values=FALLBACK_VERSIONS)
+                self.version_dropdown.set(FALLBACK_VERSIONS[0])
+            return
 
-    def versions_fetch_completed(self, versions):
-        """Handle completion of version fetching with UI state restoration"""
-        self.versions_loading = False
         self.add_log_message(f"✅ Loaded {len(versions)} versions from apkeep")
 
         # Update version dropdown
@@ -3028,6 +2844,29 @@ class XAPKInstallScreen(BaseScreen):
         self.winfo_toplevel().quit()
         self.winfo_toplevel().destroy()
 
+    def refresh_tools_status(self):
+        """Re-probe the external tools off the UI thread, e.g. after an install"""
+        threading.Thread(target=self._refresh_tools_worker, daemon=True).start()
+
+    def _refresh_tools_worker(self):
+        """Run the tool probes and hand the result to _apply_tools_status"""
+        self.tools.invalidate()
+        status = self.tools.check_tools()
+
+        # Update UI on main thread
+        self.after(0, self._apply_tools_status, status)
+
+    def _apply_tools_status(self, status):
+        """Store the re-probed tool status (UI thread only)"""
+        ready = [
+            tool
+            for tool, available in status.items()
+            if available and not self.tools_status.get(tool, False)
+        ]
+        self.tools_status = status
+        for tool in ready:
+            self.add_log_message(f"✅ {tool} is now available")
+
     def quick_setup_check(self):
         """Quick check to ensure all components are ready"""
         issues = []
@@ -3037,6 +2876,8 @@ class XAPKInstallScreen(BaseScreen):
             self.add_log_message("⚠️ Setup issues detected:")
             for issue in issues:
                 self.add_log_message(f"  • {issue}")
+            # A missing tool may have been installed since the screen was built
+            self.refresh_tools_status()
         else:
             self.add_log_message("✅ All systems ready for King God Castle processing!")
         return len(issues) == 0
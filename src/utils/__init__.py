@@ -6,5 +6,12 @@ Common utility functions and classes for the application
 from .config import ConfigManager
 from .tools import ToolsManager
 from .apk_processor import APKProcessor
+from .tk_bindings import unbind_callback, is_within_widget
 
-__all__ = ["ConfigManager", "ToolsManager", "APKProcessor"]
+__all__ = [
+    "ConfigManager",
+    "ToolsManager",
+    "APKProcessor",
+    "unbind_callback",
+    "is_within_widget",
+]
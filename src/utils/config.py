@@ -47,6 +47,24 @@ class ConfigManager:
         """Get application setting using dot notation (e.g., 'window.default_width')"""
         return self._get_nested_value(self.app_config, key_path, default)
 
+    def snapshot(self, prefix: str = "") -> Dict[str, Any]:
+        """Flatten application settings under prefix into a dot-notation dict"""
+        node = (
+            self._get_nested_value(self.app_config, prefix, {})
+            if prefix
+            else self.app_config
+        )
+        flat: Dict[str, Any] = {}
+        stack = [(prefix, node)]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, dict):
+                for key, child in value.items():
+                    stack.append((f"{path}.{key}" if path else key, child))
+            else:
+                flat[path] = value
+        return flat
+
     def get_theme_setting(self, key_path: str, default: Any = None) -> Any:
         """Get theme setting using dot notation (e.g., 'colors.primary')"""
         return self._get_nested_value(self.theme_config, key_path, default)
@@ -0,0 +1,24 @@
+"""
+Tk Binding Helpers
+Small helpers for managing Tk event bindings shared by several screens
+"""
+
+
+def unbind_callback(widget, sequence, funcid):
+    """Remove one callback from widget's binding, keeping the others"""
+    if not funcid:
+        return
+    # Tk stores every callback of a sequence in one script; drop only ours
+    script = widget.bind(sequence)
+    remaining = "\n".join(line for line in script.split("\n") if funcid not in line)
+    widget.bind(sequence, remaining)
+    widget.deletecommand(funcid)
+
+
+def is_within_widget(path, ancestor):
+    """Return True if Tk widget path is ancestor or one of its descendants"""
+    path, ancestor = str(path), str(ancestor)
+    if ancestor == ".":
+        return path.startswith(".")
+    # Compare whole path components so ".!frame" does not match ".!frame2"
+    return path == ancestor or path.startswith(ancestor + ".")
@@ -12,6 +12,7 @@ class ToolsManager:
 
     def __init__(self):
         self.scripts_dir = Path(os.path.join(os.getcwd(), "scripts"))
+        self._tools_status = None
 
     def platform(self):
         """Detect current platform for tool selection"""
@@ -48,8 +49,15 @@ class ToolsManager:
         )
         return [str(script_path)] + args
 
+    def invalidate(self):
+        """Forget the cached check_tools result, e.g. after installing a tool"""
+        self._tools_status = None
+
     def check_tools(self):
-        """Check if tools are available and working"""
+        """Check if tools are available and working (probed once, then cached)"""
+        if self._tools_status is not None:
+            return dict(self._tools_status)
+
         results = {}
 
         try:
@@ -71,7 +79,8 @@ class ToolsManager:
         except Exception:
             results["asset-ripper"] = False
 
-        return results
+        self._tools_status = results
+        return dict(results)
 
 
 tools = ToolsManager()